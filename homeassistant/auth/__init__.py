@@ -21,6 +21,11 @@ from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 EVENT_USER_ADDED = "user_added"
 EVENT_USER_REMOVED = "user_removed"
 
+# Maximum number of verified access tokens remembered
+ACCESS_TOKEN_CACHE_SIZE = 1024
+# Leeway in seconds when checking the expiration of access tokens
+ACCESS_TOKEN_LEEWAY = 10
+
 _MfaModuleDict = Dict[str, MultiFactorAuthModule]
 _ProviderKey = Tuple[str, Optional[str]]
 _ProviderDict = Dict[_ProviderKey, AuthProvider]
@@ -156,6 +161,10 @@ class AuthManager:
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
         self._revoke_callbacks: dict[str, list[CALLBACK_TYPE]] = {}
+        # Verified access tokens with their refresh token and expiration
+        self._access_tokens: OrderedDict[
+            str, tuple[models.RefreshToken, float]
+        ] = OrderedDict()
 
     @property
     def auth_providers(self) -> list[AuthProvider]:
@@ -295,6 +304,7 @@ class AuthManager:
             await asyncio.gather(*tasks)
 
         await self._store.async_remove_user(user)
+        self._async_forget_access_tokens(set(user.refresh_tokens))
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
 
@@ -452,6 +462,7 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_forget_access_tokens({refresh_token.id})
 
         callbacks = self._revoke_callbacks.pop(refresh_token.id, [])
         for revoke_callback in callbacks:
@@ -531,7 +542,18 @@ class AuthManager:
     async def async_validate_access_token(
         self, token: str
     ) -> models.RefreshToken | None:
-        """Return refresh token if an access token is valid."""
+        """Return refresh token if an access token is valid.
+
+        Verified access tokens are remembered until they expire, so only the
+        first request with a token decodes and verifies it.
+        """
+        if (cached := self._access_tokens.get(token)) is not None:
+            refresh_token, expiration = cached
+            if dt_util.utcnow().timestamp() < expiration:
+                self._access_tokens.move_to_end(token)
+                return refresh_token if refresh_token.user.is_active else None
+            del self._access_tokens[token]
+
         try:
             unverif_claims = jwt.decode(
                 token, algorithms=["HS256"], options={"verify_signature": False}
@@ -551,15 +573,42 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token,
+                jwt_key,
+                leeway=ACCESS_TOKEN_LEEWAY,
+                issuer=issuer,
+                algorithms=["HS256"],
+            )
         except jwt.InvalidTokenError:
             return None
 
-        if refresh_token is None or not refresh_token.user.is_active:
+        if refresh_token is None:
+            return None
+
+        if isinstance(expiration := claims.get("exp"), (int, float)):
+            self._access_tokens[token] = (
+                refresh_token,
+                expiration + ACCESS_TOKEN_LEEWAY,
+            )
+            while len(self._access_tokens) > ACCESS_TOKEN_CACHE_SIZE:
+                self._access_tokens.popitem(last=False)
+
+        if not refresh_token.user.is_active:
             return None
 
         return refresh_token
 
+    @callback
+    def _async_forget_access_tokens(self, refresh_token_ids: set[str]) -> None:
+        """Forget the verified access tokens of refresh tokens."""
+        for token in [
+            token
+            for token, (refresh_token, _) in self._access_tokens.items()
+            if refresh_token.id in refresh_token_ids
+        ]:
+            del self._access_tokens[token]
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
@@ -13,6 +13,7 @@ from homeassistant.auth.permissions.const import POLICY_READ
 from homeassistant.bootstrap import DATA_LOGGING
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import (
+    CONTENT_TYPE_JSON,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_TIME_CHANGED,
     MATCH_ALL,
@@ -49,6 +50,13 @@ STREAM_PING_PAYLOAD = "ping"
 STREAM_PING_INTERVAL = 50  # seconds
 
 
+def _json_response(body: str) -> web.Response:
+    """Return a JSON response from already serialized JSON."""
+    response = web.Response(body=body.encode("UTF-8"), content_type=CONTENT_TYPE_JSON)
+    response.enable_compression()
+    return response
+
+
 async def async_setup(hass, config):
     """Register the API with the HTTP interface."""
     hass.http.register_view(APIStatusView)
@@ -114,7 +122,10 @@ class APIEventStream(HomeAssistantView):
             if event.event_type == EVENT_HOMEASSISTANT_STOP:
                 data = stop_obj
             else:
-                data = json.dumps(event, cls=JSONEncoder)
+                try:
+                    data = event.as_json()
+                except (ValueError, TypeError):
+                    data = json.dumps(event, cls=JSONEncoder)
 
             await to_write.put(data)
 
@@ -199,8 +210,7 @@ class APIStatesView(HomeAssistantView):
     url = URL_API_STATES
     name = "api:states"
 
-    @ha.callback
-    def get(self, request):
+    async def get(self, request):
         """Get current states."""
         user = request["hass_user"]
         entity_perm = user.permissions.check_entity
@@ -209,7 +219,7 @@ class APIStatesView(HomeAssistantView):
             for state in request.app["hass"].states.async_all()
             if entity_perm(state.entity_id, "read")
         ]
-        return self.json(states)
+        return await self.json_stream(request, states)
 
 
 class APIEntityStateView(HomeAssistantView):
@@ -227,7 +237,10 @@ class APIEntityStateView(HomeAssistantView):
 
         state = request.app["hass"].states.get(entity_id)
         if state:
-            return self.json(state)
+            try:
+                return _json_response(state.as_json())
+            except (ValueError, TypeError):
+                return self.json(state)
         return self.json_message("Entity not found.", HTTPStatus.NOT_FOUND)
 
     async def post(self, request, entity_id):
@@ -6,7 +6,6 @@ from datetime import datetime as dt, timedelta
 from http import HTTPStatus
 import logging
 import time
-from typing import cast
 
 from aiohttp import web
 from sqlalchemy import not_, or_
@@ -191,7 +190,7 @@ class HistoryPeriodView(HomeAssistantView):
 
     async def get(
         self, request: web.Request, datetime: str | None = None
-    ) -> web.Response:
+    ) -> web.StreamResponse:
         """Return history over a period of time."""
         datetime_ = None
         if datetime:
@@ -231,6 +230,15 @@ class HistoryPeriodView(HomeAssistantView):
 
         minimal_response = "minimal_response" in request.query
 
+        max_points = None
+        if max_points_str := request.query.get("max_points"):
+            try:
+                max_points = int(max_points_str)
+            except ValueError:
+                max_points = 0
+            if max_points <= 0:
+                return self.json_message("Invalid max_points", HTTPStatus.BAD_REQUEST)
+
         hass = request.app["hass"]
 
         if (
@@ -240,21 +248,20 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
-        return cast(
-            web.Response,
-            await hass.async_add_executor_job(
-                self._sorted_significant_states_json,
-                hass,
-                start_time,
-                end_time,
-                entity_ids,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-            ),
+        result = await hass.async_add_executor_job(
+            self._sorted_significant_states,
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            max_points,
         )
+        return await self.json_stream(request, result)
 
-    def _sorted_significant_states_json(
+    def _sorted_significant_states(
         self,
         hass,
         start_time,
@@ -263,22 +270,37 @@ class HistoryPeriodView(HomeAssistantView):
         include_start_time_state,
         significant_changes_only,
         minimal_response,
+        max_points=None,
     ):
-        """Fetch significant stats from the database as json."""
+        """Fetch significant stats from the database."""
         timer_start = time.perf_counter()
 
-        with session_scope(hass=hass) as session:
-            result = history.get_significant_states_with_session(
-                hass,
-                session,
-                start_time,
-                end_time,
-                entity_ids,
-                self.filters,
-                include_start_time_state,
-                significant_changes_only,
-                minimal_response,
-            )
+        with session_scope(hass=hass, read_only=True) as session:
+            if max_points and entity_ids:
+                # Long periods are served from the downsampled history
+                result = history.get_downsampled_states_with_session(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    max_points,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                )
+            else:
+                result = history.get_significant_states_with_session(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    self.filters,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                )
 
         result = list(result.values())
         if _LOGGER.isEnabledFor(logging.DEBUG):
@@ -298,7 +320,7 @@ class HistoryPeriodView(HomeAssistantView):
             sorted_result.extend(result)
             result = sorted_result
 
-        return self.json(result)
+        return result
 
 
 def sqlalchemy_filter_from_include_exclude_conf(conf):
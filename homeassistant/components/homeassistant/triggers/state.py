@@ -1,20 +1,27 @@
 """Offer state listening automation rules."""
 from __future__ import annotations
 
+from collections.abc import Callable
 from datetime import timedelta
 import logging
-from typing import Any
+from typing import Any, cast
 
 import voluptuous as vol
 
 from homeassistant import exceptions
-from homeassistant.const import CONF_ATTRIBUTE, CONF_FOR, CONF_PLATFORM, MATCH_ALL
+from homeassistant.const import (
+    ATTR_ENTITY_ID,
+    CONF_ATTRIBUTE,
+    CONF_FOR,
+    CONF_PLATFORM,
+    EVENT_STATE_CHANGED,
+    MATCH_ALL,
+)
 from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, State, callback
 from homeassistant.helpers import config_validation as cv, template
 from homeassistant.helpers.event import (
     Event,
     async_track_same_state,
-    async_track_state_change_event,
     process_state_match,
 )
 
@@ -27,6 +34,8 @@ CONF_ENTITY_ID = "entity_id"
 CONF_FROM = "from"
 CONF_TO = "to"
 
+DATA_STATE_TRIGGER_INDEX = "state_trigger_index"
+
 BASE_SCHEMA = cv.TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_PLATFORM): "state",
@@ -65,6 +74,140 @@ def TRIGGER_SCHEMA(value: Any) -> dict:  # pylint: disable=invalid-name
     return TRIGGER_STATE_SCHEMA(value)
 
 
+class StateTriggerIndex:
+    """Index of state triggers by the entity ids they listen to.
+
+    A single state change listener is registered per entity id, it evaluates
+    all state triggers of the entity in one pass.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._triggers: dict[str, list[StateTrigger]] = {}
+        self._unsubs: dict[str, CALLBACK_TYPE] = {}
+
+    @callback
+    def async_add(self, trigger: StateTrigger) -> CALLBACK_TYPE:
+        """Add a trigger to the index."""
+        for entity_id in trigger.entity_ids:
+            if (triggers := self._triggers.get(entity_id)) is None:
+                triggers = self._triggers[entity_id] = []
+                self._unsubs[entity_id] = self.hass.bus.async_listen_keyed(
+                    EVENT_STATE_CHANGED,
+                    ATTR_ENTITY_ID,
+                    [entity_id],
+                    self._async_state_changed,
+                )
+            triggers.append(trigger)
+
+        @callback
+        def async_remove() -> None:
+            """Remove the trigger from the index."""
+            for entity_id in trigger.entity_ids:
+                triggers = self._triggers[entity_id]
+                triggers.remove(trigger)
+                if not triggers:
+                    del self._triggers[entity_id]
+                    self._unsubs.pop(entity_id)()
+
+        return async_remove
+
+    @callback
+    def async_triggers(self) -> list[StateTrigger]:
+        """Return the triggers in the index."""
+        return list(
+            {
+                id(trigger): trigger
+                for triggers in self._triggers.values()
+                for trigger in triggers
+            }.values()
+        )
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Evaluate the triggers of the entity which changed state."""
+        if not (triggers := self._triggers.get(event.data[ATTR_ENTITY_ID])):
+            return
+
+        from_s: State | None = event.data.get("old_state")
+        to_s: State | None = event.data.get("new_state")
+        values: dict[str | None, tuple[Any, Any]] = {}
+
+        for trigger in triggers[:]:
+            if (attribute_values := values.get(trigger.attribute)) is None:
+                attribute_values = values[trigger.attribute] = (
+                    _state_value(from_s, trigger.attribute),
+                    _state_value(to_s, trigger.attribute),
+                )
+            trigger.evaluations += 1
+            try:
+                trigger.listener(event, *attribute_values)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error evaluating state trigger of %s", trigger.automation
+                )
+
+
+class StateTrigger:
+    """A state trigger in the state trigger index."""
+
+    __slots__ = (
+        "automation",
+        "idx",
+        "entity_ids",
+        "attribute",
+        "listener",
+        "evaluations",
+        "matches",
+    )
+
+    def __init__(
+        self,
+        automation: str,
+        idx: str | None,
+        entity_ids: list[str],
+        attribute: str | None,
+        listener: Callable[[Event, Any, Any], None],
+    ) -> None:
+        """Initialize the trigger."""
+        self.automation = automation
+        self.idx = idx
+        self.entity_ids = entity_ids
+        self.attribute = attribute
+        self.listener = listener
+        self.evaluations = 0
+        self.matches = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the trigger and its evaluation counters as a dictionary."""
+        return {
+            "automation": self.automation,
+            "idx": self.idx,
+            "entity_id": self.entity_ids,
+            "attribute": self.attribute,
+            "evaluations": self.evaluations,
+            "matches": self.matches,
+        }
+
+
+@callback
+def async_get_state_trigger_index(hass: HomeAssistant) -> StateTriggerIndex:
+    """Return the state trigger index."""
+    if (index := hass.data.get(DATA_STATE_TRIGGER_INDEX)) is None:
+        index = hass.data[DATA_STATE_TRIGGER_INDEX] = StateTriggerIndex(hass)
+    return cast(StateTriggerIndex, index)
+
+
+def _state_value(state: State | None, attribute: str | None) -> Any:
+    """Return the state or an attribute of a state."""
+    if state is None:
+        return None
+    if attribute is None:
+        return state.state
+    return state.attributes.get(attribute)
+
+
 async def async_attach_trigger(
     hass: HomeAssistant,
     config,
@@ -91,26 +234,12 @@ async def async_attach_trigger(
     _variables = automation_info["variables"] or {}
 
     @callback
-    def state_automation_listener(event: Event):
+    def state_automation_listener(event: Event, old_value: Any, new_value: Any):
         """Listen for state changes and calls action."""
         entity: str = event.data["entity_id"]
         from_s: State | None = event.data.get("old_state")
         to_s: State | None = event.data.get("new_state")
 
-        if from_s is None:
-            old_value = None
-        elif attribute is None:
-            old_value = from_s.state
-        else:
-            old_value = from_s.attributes.get(attribute)
-
-        if to_s is None:
-            new_value = None
-        elif attribute is None:
-            new_value = to_s.state
-        else:
-            new_value = to_s.attributes.get(attribute)
-
         # When we listen for state changes with `match_all`, we
         # will trigger even if just an attribute changes. When
         # we listen to just an attribute, we should ignore all
@@ -125,6 +254,8 @@ async def async_attach_trigger(
         ):
             return
 
+        trigger.matches += 1
+
         @callback
         def call_action():
             """Call action with right context."""
@@ -192,7 +323,14 @@ async def async_attach_trigger(
             entity_ids=entity,
         )
 
-    unsub = async_track_state_change_event(hass, entity_id, state_automation_listener)
+    trigger = StateTrigger(
+        automation_info["name"],
+        trigger_data.get("idx"),
+        entity_id,
+        attribute,
+        state_automation_listener,
+    )
+    unsub = async_get_state_trigger_index(hass).async_add(trigger)
 
     @callback
     def async_remove():
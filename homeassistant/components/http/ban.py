@@ -2,10 +2,17 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable, Iterator
 from contextlib import suppress
 from datetime import datetime
-from ipaddress import ip_address
+from ipaddress import (
+    IPv4Address,
+    IPv4Network,
+    IPv6Address,
+    IPv6Network,
+    ip_address,
+    ip_network,
+)
 import logging
 from socket import gethostbyaddr, herror
 from typing import Any, Final
@@ -49,8 +56,8 @@ def setup_bans(hass: HomeAssistant, app: Application, login_threshold: int) -> N
 
     async def ban_startup(app: Application) -> None:
         """Initialize bans when app starts up."""
-        app[KEY_BANNED_IPS] = await async_load_ip_bans_config(
-            hass, hass.config.path(IP_BANS_FILE)
+        app[KEY_BANNED_IPS] = IpBans(
+            await async_load_ip_bans_config(hass, hass.config.path(IP_BANS_FILE))
         )
 
     app.on_startup.append(ban_startup)
@@ -66,12 +73,7 @@ async def ban_middleware(
         return await handler(request)
 
     # Verify if IP is not banned
-    ip_address_ = ip_address(request.remote)
-    is_banned = any(
-        ip_ban.ip_address == ip_address_ for ip_ban in request.app[KEY_BANNED_IPS]
-    )
-
-    if is_banned:
+    if ip_address(request.remote) in request.app[KEY_BANNED_IPS]:
         raise HTTPForbidden()
 
     try:
@@ -145,7 +147,8 @@ async def process_wrong_login(request: Request) -> None:
         >= request.app[KEY_LOGIN_THRESHOLD]
     ):
         new_ban = IpBan(remote_addr)
-        request.app[KEY_BANNED_IPS].append(new_ban)
+        request.app[KEY_BANNED_IPS].add(new_ban)
+        request.app[KEY_FAILED_LOGIN_ATTEMPTS].pop(remote_addr)
 
         await hass.async_add_executor_job(
             update_ip_bans_config, hass.config.path(IP_BANS_FILE), new_ban
@@ -184,13 +187,69 @@ async def process_success_login(request: Request) -> None:
 
 
 class IpBan:
-    """Represents banned IP address."""
+    """Represents banned IP address or network."""
 
-    def __init__(self, ip_ban: str, banned_at: datetime | None = None) -> None:
+    def __init__(
+        self,
+        ip_ban: str | IPv4Address | IPv6Address,
+        banned_at: datetime | None = None,
+    ) -> None:
         """Initialize IP Ban object."""
-        self.ip_address = ip_address(ip_ban)
+        self.ip_network: IPv4Network | IPv6Network = ip_network(ip_ban)
         self.banned_at = banned_at or dt_util.utcnow()
 
+    @property
+    def ip_address(self) -> IPv4Address | IPv6Address:
+        """Return the first address of the banned network."""
+        return self.ip_network.network_address
+
+    def __str__(self) -> str:
+        """Return the banned address, or the network in CIDR notation."""
+        if self.ip_network.num_addresses == 1:
+            return str(self.ip_network.network_address)
+        return str(self.ip_network)
+
+
+class IpBans:
+    """Banned IP addresses and networks, indexed for constant time lookups.
+
+    Networks are kept in a set per prefix length, an address is looked up
+    by masking it with each prefix length in use.
+    """
+
+    def __init__(self, ip_bans: Iterable[IpBan] = ()) -> None:
+        """Initialize the banned IP addresses."""
+        self._ip_bans: list[IpBan] = []
+        self._networks: dict[
+            tuple[int, int], set[IPv4Network | IPv6Network]
+        ] = defaultdict(set)
+        for ip_ban in ip_bans:
+            self.add(ip_ban)
+
+    def add(self, ip_ban: IpBan) -> None:
+        """Add a banned IP address or network."""
+        network = ip_ban.ip_network
+        self._ip_bans.append(ip_ban)
+        self._networks[(network.version, network.prefixlen)].add(network)
+
+    def __contains__(self, address: IPv4Address | IPv6Address) -> bool:
+        """Return if an IP address is banned."""
+        for (version, prefixlen), networks in self._networks.items():
+            if (
+                version == address.version
+                and ip_network((address, prefixlen), strict=False) in networks
+            ):
+                return True
+        return False
+
+    def __iter__(self) -> Iterator[IpBan]:
+        """Iterate over the banned IP addresses and networks."""
+        return iter(self._ip_bans)
+
+    def __len__(self) -> int:
+        """Return the number of banned IP addresses and networks."""
+        return len(self._ip_bans)
+
 
 async def async_load_ip_bans_config(hass: HomeAssistant, path: str) -> list[IpBan]:
     """Load list of banned IPs from config file."""
@@ -208,7 +267,7 @@ async def async_load_ip_bans_config(hass: HomeAssistant, path: str) -> list[IpBa
         try:
             ip_info = SCHEMA_IP_BAN_ENTRY(ip_info)
             ip_list.append(IpBan(ip_ban, ip_info["banned_at"]))
-        except vol.Invalid as err:
+        except (vol.Invalid, ValueError) as err:
             _LOGGER.error("Failed to load IP ban %s: %s", ip_info, err)
             continue
 
@@ -218,6 +277,6 @@ async def async_load_ip_bans_config(hass: HomeAssistant, path: str) -> list[IpBa
 def update_ip_bans_config(path: str, ip_ban: IpBan) -> None:
     """Update config file with new banned IP address."""
     with open(path, "a", encoding="utf8") as out:
-        ip_ = {str(ip_ban.ip_address): {ATTR_BANNED_AT: ip_ban.banned_at.isoformat()}}
+        ip_ = {str(ip_ban): {ATTR_BANNED_AT: ip_ban.banned_at.isoformat()}}
         out.write("\n")
         out.write(yaml.dump(ip_))
@@ -21,7 +21,7 @@ import voluptuous as vol
 from homeassistant import exceptions
 from homeassistant.const import CONTENT_TYPE_JSON, HTTP_OK
 from homeassistant.core import Context, is_callback
-from homeassistant.helpers.json import JSONEncoder
+from homeassistant.helpers.json import JSONEncoder, json_stream
 
 from .const import KEY_AUTHENTICATED, KEY_HASS
 
@@ -67,6 +67,40 @@ class HomeAssistantView:
         response.enable_compression()
         return response
 
+    @staticmethod
+    async def json_stream(
+        request: web.Request,
+        result: Any,
+        status_code: HTTPStatus | int = HTTPStatus.OK,
+        headers: LooseHeaders | None = None,
+    ) -> web.StreamResponse:
+        """Return a JSON response which is encoded and sent in chunks.
+
+        The chunks are encoded in the executor, so large results are never
+        serialized to one string.
+        """
+        hass = request.app[KEY_HASS]
+        chunks = json_stream(result)
+        try:
+            chunk = await hass.async_add_executor_job(next, chunks, None)
+        except (ValueError, TypeError) as err:
+            _LOGGER.error("Unable to serialize to JSON: %s", err)
+            raise HTTPInternalServerError from err
+        response = web.StreamResponse(status=int(status_code), headers=headers)
+        response.content_type = CONTENT_TYPE_JSON
+        response.enable_compression()
+        await response.prepare(request)
+        while chunk is not None:
+            await response.write(chunk.encode("UTF-8"))
+            try:
+                chunk = await hass.async_add_executor_job(next, chunks, None)
+            except (ValueError, TypeError) as err:
+                # The response has started, the connection is closed instead
+                _LOGGER.error("Unable to serialize to JSON: %s", err)
+                raise HTTPInternalServerError from err
+        await response.write_eof()
+        return response
+
     def json_message(
         self,
         message: str,
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
 from collections.abc import Callable
 import concurrent.futures
 from datetime import datetime, timedelta
@@ -14,9 +15,9 @@ from typing import Any, NamedTuple
 
 from sqlalchemy import create_engine, event as sqlalchemy_event, exc, func, select
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy.orm import make_transient, scoped_session, sessionmaker
 from sqlalchemy.orm.session import Session
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import QueuePool, StaticPool
 import voluptuous as vol
 
 from homeassistant.components import persistent_notification
@@ -51,11 +52,13 @@ from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
 
 from . import history, migration, purge, statistics, websocket_api
+from .accumulators import StateAccumulators
 from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
 from .models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -68,6 +71,7 @@ from .util import (
     perodic_db_cleanups,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_only_connection_for_dialect,
     validate_or_move_away_sqlite_database,
 )
 
@@ -111,15 +115,22 @@ DEFAULT_DB_FILE = "home-assistant_v2.db"
 DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
+DEFAULT_DB_MAX_READERS = 4
 DEFAULT_COMMIT_INTERVAL = 1
 KEEPALIVE_TIME = 30
 
-# Controls how often we clean up
-# States and Events objects
-EXPIRE_AFTER_COMMITS = 120
+# The number of attribute ids to cache in memory
+#
+# Based on:
+# - The number of overlapping attributes
+# - How frequently states with overlapping attributes will change
+# - How much memory our low end hardware has
+STATE_ATTRIBUTES_ID_CACHE_SIZE = 2048
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_DB_URL = "db_url"
+CONF_DB_READ_URL = "db_read_url"
+CONF_DB_MAX_READERS = "db_max_readers"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
@@ -151,6 +162,10 @@ CONFIG_SCHEMA = vol.Schema(
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
                     vol.Optional(CONF_DB_URL): cv.string,
+                    vol.Optional(CONF_DB_READ_URL): cv.string,
+                    vol.Optional(
+                        CONF_DB_MAX_READERS, default=DEFAULT_DB_MAX_READERS
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
@@ -247,6 +262,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     db_url = conf.get(CONF_DB_URL) or DEFAULT_URL.format(
         hass_config_path=hass.config.path(DEFAULT_DB_FILE)
     )
+    db_read_url = conf.get(CONF_DB_READ_URL)
+    db_max_readers = conf[CONF_DB_MAX_READERS]
     exclude = conf[CONF_EXCLUDE]
     exclude_t = exclude.get(CONF_EVENT_TYPES, [])
     instance = hass.data[DATA_INSTANCE] = Recorder(
@@ -259,6 +276,8 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_t=exclude_t,
+        db_read_url=db_read_url,
+        db_max_readers=db_max_readers,
     )
     instance.async_initialize()
     instance.start()
@@ -365,6 +384,14 @@ class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
 
+class CommitTask:
+    """An object to insert into the recorder queue to commit the pending events."""
+
+
+class KeepAliveTask:
+    """An object to insert into the recorder queue to keep the connection open."""
+
+
 class Recorder(threading.Thread):
     """A threaded recorder class."""
 
@@ -379,6 +406,8 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_t: list[str],
+        db_read_url: str | None = None,
+        db_max_readers: int = DEFAULT_DB_MAX_READERS,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -392,27 +421,34 @@ class Recorder(threading.Thread):
         self.db_url = uri
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
+        self.db_read_url = db_read_url
+        self.db_max_readers = db_max_readers
         self.async_db_ready: asyncio.Future = asyncio.Future()
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Any = None
+        self.read_engine: Any = None
         self.run_info: Any = None
 
         self.entity_filter = entity_filter
         self.exclude_t = exclude_t
 
-        self._timechanges_seen = 0
-        self._commits_without_expire = 0
-        self._keepalive_count = 0
         self._old_states: dict[str, States] = {}
-        self._pending_expunge: list[States] = []
+        self._state_attributes_ids: OrderedDict[str, int] = OrderedDict()
+        self._pending_state_attributes: dict[str, StateAttributes] = {}
+        self._pending_events: list[Events] = []
+        self._pending_states: list[tuple[States, Events, StateAttributes | None]] = []
+        self.state_accumulators = StateAccumulators(self.recording_start)
         self.event_session = None
         self.get_session = None
+        self.get_read_session = None
         self._completed_first_database_setup = None
         self._event_listener = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
         self._queue_watcher = None
+        self._commit_listener = None
+        self._keep_alive_listener = None
         self._db_supports_row_number = True
 
         self.enabled = True
@@ -430,6 +466,41 @@ class Recorder(threading.Thread):
         self._queue_watcher = async_track_time_interval(
             self.hass, self._async_check_queue, timedelta(minutes=10)
         )
+        self._keep_alive_listener = self._async_queue_periodically(
+            KEEPALIVE_TIME, KeepAliveTask
+        )
+        if self.commit_interval:
+            self._commit_listener = self._async_queue_periodically(
+                self.commit_interval, CommitTask
+            )
+
+    @callback
+    def _async_queue_periodically(
+        self, interval: float, task_type: type
+    ) -> Callable[[], None]:
+        """Put a task in the queue every interval seconds.
+
+        The loop clock is used so the interval does not depend on
+        the wall clock, and no time changed event has to be queued.
+        """
+        handle: asyncio.TimerHandle | None = None
+
+        @callback
+        def _async_queue_task() -> None:
+            """Queue the task and schedule the next one."""
+            nonlocal handle
+            self.queue.put(task_type())
+            handle = self.hass.loop.call_later(interval, _async_queue_task)
+
+        handle = self.hass.loop.call_later(interval, _async_queue_task)
+
+        @callback
+        def _async_cancel() -> None:
+            """Stop queueing the task."""
+            assert handle is not None
+            handle.cancel()
+
+        return _async_cancel
 
     @callback
     def _async_check_queue(self, *_):
@@ -456,6 +527,12 @@ class Recorder(threading.Thread):
         if self._event_listener:
             self._event_listener()
             self._event_listener = None
+        if self._keep_alive_listener:
+            self._keep_alive_listener()
+            self._keep_alive_listener = None
+        if self._commit_listener:
+            self._commit_listener()
+            self._commit_listener = None
 
     @callback
     def _async_event_filter(self, event) -> bool:
@@ -463,6 +540,10 @@ class Recorder(threading.Thread):
         if event.event_type in self.exclude_t:
             return False
 
+        # Commits and keep alives run on their own intervals
+        if event.event_type == EVENT_TIME_CHANGED:
+            return False
+
         entity_id = event.data.get(ATTR_ENTITY_ID)
 
         if entity_id is None:
@@ -776,6 +857,9 @@ class Recorder(threading.Thread):
 
     def _process_one_event(self, event):
         """Process one event."""
+        if isinstance(event, (PurgeTask, PurgeEntitiesTask, StatisticsTask)):
+            # Write the buffered events and states so the task can see them
+            self._commit_event_session_or_retry()
         if isinstance(event, PurgeTask):
             self._run_purge(event.purge_before, event.repack, event.apply_filter)
             return
@@ -799,19 +883,16 @@ class Recorder(threading.Thread):
         if isinstance(event, WaitTask):
             self._queue_watch.set()
             return
-        if event.event_type == EVENT_TIME_CHANGED:
-            self._keepalive_count += 1
-            if self._keepalive_count >= KEEPALIVE_TIME:
-                self._keepalive_count = 0
-                self._send_keep_alive()
-            if self.commit_interval:
-                self._timechanges_seen += 1
-                if self._timechanges_seen >= self.commit_interval:
-                    self._timechanges_seen = 0
-                    self._commit_event_session_or_retry()
+        if isinstance(event, CommitTask):
+            self._commit_event_session_or_retry()
+            return
+        if isinstance(event, KeepAliveTask):
+            self._send_keep_alive()
             return
 
         if not self.enabled:
+            # States are missing from the summaries until recording resumes
+            self.state_accumulators.reset(event.time_fired)
             return
 
         try:
@@ -820,40 +901,84 @@ class Recorder(threading.Thread):
             else:
                 dbevent = Events.from_event(event)
             dbevent.created = event.time_fired
-            self.event_session.add(dbevent)
         except (TypeError, ValueError):
             _LOGGER.warning("Event is not JSON serializable: %s", event)
             return
+        self._pending_events.append(dbevent)
 
         if event.event_type == EVENT_STATE_CHANGED:
             try:
                 dbstate = States.from_event(event)
-                has_new_state = event.data.get("new_state")
-                if dbstate.entity_id in self._old_states:
-                    old_state = self._old_states.pop(dbstate.entity_id)
-                    if old_state.state_id:
-                        dbstate.old_state_id = old_state.state_id
-                    else:
-                        dbstate.old_state = old_state
-                if not has_new_state:
-                    dbstate.state = None
-                dbstate.event = dbevent
-                dbstate.created = event.time_fired
-                self.event_session.add(dbstate)
-                if has_new_state:
-                    self._old_states[dbstate.entity_id] = dbstate
-                    self._pending_expunge.append(dbstate)
+                shared_attrs = StateAttributes.shared_attrs_from_event(event)
             except (TypeError, ValueError):
                 _LOGGER.warning(
                     "State is not JSON serializable: %s",
                     event.data.get("new_state"),
                 )
+            else:
+                if not event.data.get("new_state"):
+                    dbstate.state = None
+                dbstate.created = event.time_fired
+                dbstate_attributes = self._link_state_attributes(dbstate, shared_attrs)
+                self._pending_states.append((dbstate, dbevent, dbstate_attributes))
+                self.state_accumulators.add_state(
+                    event.data["entity_id"],
+                    event.data.get("new_state"),
+                    event.time_fired,
+                )
 
         # If they do not have a commit interval
         # than we commit right away
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _link_state_attributes(
+        self, dbstate: States, shared_attrs: str
+    ) -> StateAttributes | None:
+        """Point the state at a shared attributes row.
+
+        Returns the pending attributes row when it has not been
+        written yet and the attributes_id is only known after the
+        next commit.
+        """
+        # Matching attributes found in the pending commit
+        if pending_attributes := self._pending_state_attributes.get(shared_attrs):
+            return pending_attributes
+        # Matching attributes id found in the cache
+        if attributes_id := self._state_attributes_ids.get(shared_attrs):
+            self._state_attributes_ids.move_to_end(shared_attrs)
+            dbstate.attributes_id = attributes_id
+            return None
+        attr_hash = StateAttributes.hash_shared_attrs(shared_attrs)
+        # Matching attributes found in the database
+        if attributes_id := self._find_shared_attr_in_db(attr_hash, shared_attrs):
+            self._cache_state_attributes_id(shared_attrs, attributes_id)
+            dbstate.attributes_id = attributes_id
+            return None
+        # No matching attributes found, save them in the DB
+        dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=attr_hash)
+        self._pending_state_attributes[shared_attrs] = dbstate_attributes
+        return dbstate_attributes
+
+    def _find_shared_attr_in_db(self, attr_hash: int, shared_attrs: str) -> int | None:
+        """Find shared attributes in the db from the hash and shared_attrs."""
+        # The lookup has already checked to see if the data is cached
+        # or going to be written in the next commit so there is no
+        # need to write the pending rows before checking the database.
+        attributes = (
+            self.event_session.query(StateAttributes.attributes_id)
+            .filter(StateAttributes.hash == attr_hash)
+            .filter(StateAttributes.shared_attrs == shared_attrs)
+            .first()
+        )
+        return attributes.attributes_id if attributes else None
+
+    def _cache_state_attributes_id(self, shared_attrs: str, attributes_id: int) -> None:
+        """Remember the attributes id, evicting the least recently used entry."""
+        self._state_attributes_ids[shared_attrs] = attributes_id
+        if len(self._state_attributes_ids) > STATE_ATTRIBUTES_ID_CACHE_SIZE:
+            self._state_attributes_ids.popitem(last=False)
+
     def _handle_database_error(self, err):
         """Handle a database error that may result in moving away the corrupt db."""
         if isinstance(err.__cause__, sqlite3.DatabaseError):
@@ -866,7 +991,11 @@ class Recorder(threading.Thread):
 
     def _commit_event_session_or_retry(self):
         """Commit the event session if there is work to do."""
-        if not self.event_session.new and not self.event_session.dirty:
+        if (
+            not self._pending_events
+            and not self.event_session.new
+            and not self.event_session.dirty
+        ):
             return
         tries = 1
         while tries <= self.db_max_retries:
@@ -887,24 +1016,118 @@ class Recorder(threading.Thread):
                 time.sleep(self.db_retry_wait)
 
     def _commit_event_session(self):
-        self._commits_without_expire += 1
-
-        if self._pending_expunge:
-            self.event_session.flush()
-            for dbstate in self._pending_expunge:
-                # Expunge the state so its not expired
-                # until we use it later for dbstate.old_state
-                if dbstate in self.event_session:
-                    self.event_session.expunge(dbstate)
-            self._pending_expunge = []
-        self.event_session.commit()
-
-        # Expire is an expensive operation (frequently more expensive
-        # than the flush and commit itself) so we only
-        # do it after EXPIRE_AFTER_COMMITS commits
-        if self._commits_without_expire == EXPIRE_AFTER_COMMITS:
-            self._commits_without_expire = 0
-            self.event_session.expire_all()
+        try:
+            old_states = self._write_pending_events_and_states()
+            self.event_session.commit()
+        except Exception:
+            self._rollback_pending_writes()
+            raise
+
+        self._old_states = old_states
+        # Once the attributes have been written they are
+        # referenced by id in later states
+        for shared_attrs, dbstate_attributes in self._pending_state_attributes.items():
+            self._cache_state_attributes_id(
+                shared_attrs, dbstate_attributes.attributes_id
+            )
+        self._clear_pending_writes()
+
+    def _write_pending_events_and_states(self) -> dict[str, States]:
+        """Write the buffered events, attributes and states with bulk inserts.
+
+        The rows never enter the session identity map which avoids the
+        unit of work overhead of tracking every row and the old_state
+        relationship; old_state_id is resolved in memory instead.
+
+        Returns the old states cache to use once the commit succeeds.
+        """
+        old_states = dict(self._old_states)
+        if not self._pending_events:
+            return old_states
+
+        if self._pending_state_attributes:
+            self._bulk_insert(
+                list(self._pending_state_attributes.values()),
+                StateAttributes.attributes_id,
+            )
+        self._bulk_insert(self._pending_events, Events.event_id)
+
+        pending_states = []
+        for dbstate, dbevent, dbstate_attributes in self._pending_states:
+            dbstate.event_id = dbevent.event_id
+            if dbstate_attributes is not None:
+                dbstate.attributes_id = dbstate_attributes.attributes_id
+            pending_states.append(dbstate)
+
+        # A state can only be linked to its old state once the old state has
+        # a state_id, so the states are written in generations where every
+        # entity appears at most once.
+        while pending_states:
+            generation: list[States] = []
+            deferred: list[States] = []
+            entity_ids: set[str] = set()
+            for dbstate in pending_states:
+                if dbstate.entity_id in entity_ids:
+                    deferred.append(dbstate)
+                    continue
+                entity_ids.add(dbstate.entity_id)
+                if old_state := old_states.pop(dbstate.entity_id, None):
+                    dbstate.old_state_id = old_state.state_id
+                if dbstate.state is not None:
+                    old_states[dbstate.entity_id] = dbstate
+                generation.append(dbstate)
+            self._bulk_insert(generation, States.state_id)
+            pending_states = deferred
+
+        return old_states
+
+    def _bulk_insert(self, rows: list[Any], primary_key: Any) -> None:
+        """Insert rows and set their primary keys.
+
+        SQLite allows a single writer, so until the transaction is committed
+        the inserted rows have the highest ids, in the order they were
+        inserted. There consecutive rows setting the same columns share one
+        executemany and the ids are read back. Other databases may hand out
+        ids to concurrent writers in between, the ids are returned by the
+        inserts instead.
+        """
+        if self.engine.dialect.name != "sqlite":
+            self.event_session.bulk_save_objects(rows, return_defaults=True)
+            return
+        self.event_session.bulk_save_objects(rows)
+        row_ids = [
+            row_id
+            for (row_id,) in self.event_session.query(primary_key)
+            .order_by(primary_key.desc())
+            .limit(len(rows))
+        ]
+        for row, row_id in zip(rows, reversed(row_ids)):
+            setattr(row, primary_key.key, row_id)
+
+    def _rollback_pending_writes(self):
+        """Rollback the event session so the pending rows can be written again."""
+        self.event_session.rollback()
+        # The primary keys and identities were assigned by the rolled back
+        # inserts, drop them so the rows are inserted again on retry.
+        for dbstate_attributes in self._pending_state_attributes.values():
+            make_transient(dbstate_attributes)
+            dbstate_attributes.attributes_id = None
+        for dbevent in self._pending_events:
+            make_transient(dbevent)
+            dbevent.event_id = None
+        for dbstate, _, dbstate_attributes in self._pending_states:
+            make_transient(dbstate)
+            dbstate.state_id = None
+            dbstate.event_id = None
+            dbstate.old_state_id = None
+            if dbstate_attributes is not None:
+                dbstate.attributes_id = None
+
+    def _clear_pending_writes(self):
+        """Clear the buffered events, attributes and states."""
+        self._pending_events = []
+        self._pending_states = []
+        self._pending_state_attributes = {}
 
     def _handle_sqlite_corruption(self):
         """Handle the sqlite3 database being corrupt."""
@@ -917,6 +1140,8 @@ class Recorder(threading.Thread):
     def _close_event_session(self):
         """Close the event session."""
         self._old_states = {}
+        self._state_attributes_ids = OrderedDict()
+        self._clear_pending_writes()
 
         if not self.event_session:
             return
@@ -998,8 +1223,43 @@ class Recorder(threading.Thread):
 
         Base.metadata.create_all(self.engine)
         self.get_session = scoped_session(sessionmaker(bind=self.engine))
+        self._setup_read_connection()
         _LOGGER.debug("Connected to recorder database")
 
+    def _setup_read_connection(self):
+        """Set up the engine used by history, logbook and statistics reads.
+
+        Reads use their own pool of at most db_max_readers connections
+        so long running queries never hold up the recorder thread.
+        """
+        if self.db_read_url is None and (
+            self.db_url == SQLITE_URL_PREFIX or ":memory:" in self.db_url
+        ):
+            # An in memory database only exists on the recorder connection
+            self.read_engine = None
+            self.get_read_session = self.get_session
+            return
+
+        db_read_url = self.db_read_url or self.db_url
+        kwargs = {
+            "poolclass": QueuePool,
+            "pool_size": self.db_max_readers,
+            "max_overflow": 0,
+        }
+        if db_read_url.startswith(SQLITE_URL_PREFIX):
+            kwargs["connect_args"] = {"check_same_thread": False}
+
+        self.read_engine = create_engine(db_read_url, **kwargs)
+
+        def setup_read_connection(dbapi_connection, connection_record):
+            """Dbapi specific read only connection settings."""
+            setup_read_only_connection_for_dialect(
+                self.read_engine.dialect.name, dbapi_connection
+            )
+
+        sqlalchemy_event.listen(self.read_engine, "connect", setup_read_connection)
+        self.get_read_session = scoped_session(sessionmaker(bind=self.read_engine))
+
     @property
     def _using_file_sqlite(self):
         """Short version to check if we are using sqlite3 as a file."""
@@ -1009,6 +1269,10 @@ class Recorder(threading.Thread):
 
     def _close_connection(self):
         """Close the connection."""
+        if self.read_engine is not None:
+            self.read_engine.dispose()
+            self.read_engine = None
+        self.get_read_session = None
         self.engine.dispose()
         self.engine = None
         self.get_session = None
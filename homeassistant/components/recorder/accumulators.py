@@ -0,0 +1,195 @@
+"""Running summaries of numeric states, fed from the recorder write path."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+import math
+
+from homeassistant.const import ATTR_UNIT_OF_MEASUREMENT
+from homeassistant.core import State
+
+PERIOD_DURATION = timedelta(minutes=5)
+
+
+def _period_start(time: datetime) -> datetime:
+    """Return the start of the 5-minute statistics period time is in."""
+    return time.replace(minute=time.minute - time.minute % 5, second=0, microsecond=0)
+
+
+def float_or_none(state: str | None) -> float | None:
+    """Return the state as a finite float, or None if it is not numeric."""
+    try:
+        value = float(state)  # type: ignore[arg-type]
+    except (ValueError, TypeError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+@dataclass
+class NumericStateAccumulator:
+    """Running summary of the numeric states of an entity during a period.
+
+    The value known before the period starts is included, matching the
+    summaries compiled from the history of the period. A stopped summary ended
+    with a non-numeric state, its last value is not carried into later periods.
+    """
+
+    first_time: datetime
+    last_time: datetime
+    last_value: float
+    min: float
+    max: float
+    units: set[str | None] = field(default_factory=set)
+    weighted_sum: float = 0.0
+    initial: tuple[float, str | None] | None = None
+    stopped: bool = False
+
+    @classmethod
+    def from_value(
+        cls, value: float, unit: str | None, time: datetime
+    ) -> NumericStateAccumulator:
+        """Start a summary at a value."""
+        return cls(time, time, value, value, value, {unit})
+
+    def add(self, value: float, unit: str | None, time: datetime) -> None:
+        """Add a value which took effect at time."""
+        self.stopped = False
+        if time <= self.first_time:
+            # The previous values were replaced before any time passed
+            self.last_value = self.min = self.max = value
+            self.units = {unit}
+            return
+        if time > self.last_time:
+            self.weighted_sum += (
+                self.last_value * (time - self.last_time).total_seconds()
+            )
+            self.last_time = time
+        self.last_value = value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.units.add(unit)
+
+    def time_weighted_mean(self, end: datetime) -> float:
+        """Return the mean of the values, weighted by how long they were valid."""
+        duration = (end - self.first_time).total_seconds()
+        if duration <= 0:
+            return self.last_value
+        weighted_sum = (
+            self.weighted_sum + self.last_value * (end - self.last_time).total_seconds()
+        )
+        return weighted_sum / duration
+
+
+class StateAccumulators:
+    """Accumulate numeric states per 5-minute period as they are recorded.
+
+    Only the previous and the current period are kept once states of a new
+    period are recorded. Older periods are left to be compiled from history.
+
+    Only the recorder thread may access the accumulators.
+    """
+
+    def __init__(self, started: datetime) -> None:
+        """Initialize the accumulators."""
+        self._started = started
+        self._periods: dict[datetime, dict[str, NumericStateAccumulator]] = {}
+        self._last_values: dict[str, tuple[float, str | None]] = {}
+
+    def reset(self, started: datetime) -> None:
+        """Drop all summaries, states are not accumulated before started."""
+        self._started = started
+        self._periods.clear()
+        self._last_values.clear()
+
+    def covers(self, start: datetime) -> bool:
+        """Return if all states of the period at start have been accumulated."""
+        return self._started <= start and _period_start(start) == start
+
+    def add_state(
+        self, entity_id: str, state: State | None, time_fired: datetime
+    ) -> None:
+        """Accumulate a recorded state, state is None if the entity was removed.
+
+        A non-numeric state is skipped like in the history of the period, the
+        value before it stays valid until the period ends but is not carried
+        into later periods.
+        """
+        time = state.last_updated if state else time_fired
+        start = _period_start(time)
+        if (period := self._periods.get(start)) is None:
+            self._prune_periods(start - PERIOD_DURATION)
+            period = self._periods[start] = {}
+        accumulator = period.get(entity_id)
+
+        if state is None or (value := float_or_none(state.state)) is None:
+            previous = self._last_values.pop(entity_id, None)
+            if accumulator is None and previous:
+                accumulator = period[entity_id] = self._carried(previous, start)
+            if accumulator:
+                accumulator.stopped = True
+            return
+
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if accumulator:
+            accumulator.add(value, unit, time)
+        elif previous := self._last_values.get(entity_id):
+            accumulator = period[entity_id] = self._carried(previous, start)
+            accumulator.add(value, unit, time)
+        else:
+            period[entity_id] = NumericStateAccumulator.from_value(value, unit, time)
+        self._last_values[entity_id] = (value, unit)
+
+    @staticmethod
+    def _carried(
+        previous: tuple[float, str | None], start: datetime
+    ) -> NumericStateAccumulator:
+        """Start a summary of a period from the value known when it started."""
+        accumulator = NumericStateAccumulator.from_value(*previous, start)
+        accumulator.initial = previous
+        return accumulator
+
+    def _prune_periods(self, keep_from: datetime) -> None:
+        """Forget the periods before keep_from, they are no longer covered."""
+        for old_start in [old for old in self._periods if old < keep_from]:
+            del self._periods[old_start]
+        self._started = max(self._started, keep_from)
+
+    def summarize_period(
+        self, start: datetime, entity_ids: list[str]
+    ) -> dict[str, NumericStateAccumulator]:
+        """Return the summaries of the period at start and forget older periods.
+
+        Entities without state changes during the period are summarized
+        from the value they had when the period started.
+        """
+        for old_start in [old for old in self._periods if old < start]:
+            del self._periods[old_start]
+        period = self._periods.get(start, {})
+        later_periods = [
+            self._periods[later] for later in sorted(self._periods) if later > start
+        ]
+
+        summaries: dict[str, NumericStateAccumulator] = {}
+        for entity_id in entity_ids:
+            if accumulator := period.get(entity_id):
+                summaries[entity_id] = accumulator
+                continue
+            # The value when the period started is the value the next period
+            # with state changes started with, or the latest value
+            previous = self._last_values.get(entity_id)
+            for later_period in later_periods:
+                if later := later_period.get(entity_id):
+                    previous = later.initial
+                    break
+            if previous:
+                summaries[entity_id] = NumericStateAccumulator.from_value(
+                    *previous, start
+                )
+        return summaries
+
+    def summarize_all(self, start: datetime) -> dict[str, NumericStateAccumulator]:
+        """Return the summaries of all entities with a numeric value in the period."""
+        entity_ids = set(self._last_values)
+        for period in self._periods.values():
+            entity_ids.update(period)
+        return self.summarize_period(start, sorted(entity_ids))
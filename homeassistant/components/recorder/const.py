@@ -13,3 +13,8 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 # We can increase this back to 1000 once most
 # have upgraded their sqlite version
 MAX_ROWS_TO_PURGE = 998
+
+# The maximum span of event ids we purge in one pass. Expired rows are removed
+# with range predicates on the primary keys so a chunk can be much larger than
+# the number of bound parameters sqlite allows in an IN clause.
+MAX_IDS_PER_PURGE_CHUNK = 10000
@@ -10,15 +10,13 @@ from sqlalchemy import and_, bindparam, func
 from sqlalchemy.ext import baked
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder.models import (
-    States,
-    process_timestamp_to_utc_isoformat,
-)
+from homeassistant.components.recorder.models import StateAttributes, States
 from homeassistant.components.recorder.util import execute, session_scope
 from homeassistant.core import split_entity_id
 import homeassistant.util.dt as dt_util
 
 from .models import LazyState
+from .rollups import get_rollups_with_session, rollup_tier_for_period
 
 # mypy: allow-untyped-defs, no-check-untyped-defs
 
@@ -48,6 +46,7 @@ QUERY_STATES = [
     States.entity_id,
     States.state,
     States.attributes,
+    StateAttributes.shared_attrs,
     States.last_changed,
     States.last_updated,
 ]
@@ -60,9 +59,16 @@ def async_setup(hass):
     hass.data[HISTORY_BAKERY] = baked.bakery()
 
 
+def _query_states_with_attributes(session):
+    """Query states joined with their shared attributes."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
+
 def get_significant_states(hass, *args, **kwargs):
     """Wrap get_significant_states_with_session with an sql session."""
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         return get_significant_states_with_session(hass, session, *args, **kwargs)
 
 
@@ -91,9 +97,7 @@ def get_significant_states_with_session(
     """
     timer_start = time.perf_counter()
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states_with_attributes)
 
     if significant_changes_only:
         baked_query += lambda q: q.filter(
@@ -142,12 +146,78 @@ def get_significant_states_with_session(
     )
 
 
+def get_downsampled_states_with_session(
+    hass,
+    session,
+    start_time,
+    end_time,
+    entity_ids,
+    max_points,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+):
+    """
+    Return states changes during UTC period start_time - end_time, downsampled.
+
+    The rollup tier is picked from the length of the period so each entity
+    returns roughly max_points points. Numeric entities with rollups in that
+    tier are served from their state at start_time followed by the rollups,
+    all other entities and short periods fall back to the significant states.
+    """
+    tier = rollup_tier_for_period(start_time, end_time, max_points)
+    if tier is None or not include_start_time_state:
+        return get_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+        )
+
+    initial_states = {}
+    if rollups := get_rollups_with_session(
+        session, tier, start_time, end_time, entity_ids
+    ):
+        initial_states = {
+            state.entity_id: state
+            for state in _get_states_with_session(
+                hass, session, start_time, list(rollups)
+            )
+        }
+
+    result = {}
+    if raw_entity_ids := [
+        entity_id for entity_id in entity_ids if entity_id not in initial_states
+    ]:
+        result = get_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            raw_entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+        )
+    for entity_id, state in initial_states.items():
+        result[entity_id] = [state, *rollups[entity_id]]
+
+    # Keep the order of the requested entity_ids
+    return {
+        entity_id: result[entity_id] for entity_id in entity_ids if entity_id in result
+    }
+
+
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
-    with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+    with session_scope(hass=hass, read_only=True) as session:
+        baked_query = hass.data[HISTORY_BAKERY](_query_states_with_attributes)
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -160,7 +230,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -180,14 +252,14 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     """Return the last number_of_states."""
     start_time = dt_util.utcnow()
 
-    with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+    with session_scope(hass=hass, read_only=True) as session:
+        baked_query = hass.data[HISTORY_BAKERY](_query_states_with_attributes)
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -223,7 +295,7 @@ def get_states(hass, utc_point_in_time, entity_ids=None, run=None, filters=None)
         if run is None:
             return []
 
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         return _get_states_with_session(
             hass, session, utc_point_in_time, entity_ids, run, filters
         )
@@ -247,7 +319,7 @@ def _get_states_with_session(
 
     # We have more than one entity to look at so we need to do a query on states
     # since the last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states_with_attributes(session)
 
     if entity_ids:
         # We got an include-list of entities, accelerate the query by filtering already
@@ -312,9 +384,7 @@ def _get_states_with_session(
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](_query_states_with_attributes)
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -371,10 +441,6 @@ def _sorted_states_to_dict(
         elapsed = time.perf_counter() - timer_start
         _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
 
-    # Called in a tight loop so cache the function
-    # here
-    _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
-
     # Append all changes to it
     for ent_id, group in groupby(states, lambda state: state.entity_id):
         domain = split_entity_id(ent_id)[0]
@@ -401,9 +467,8 @@ def _sorted_states_to_dict(
             ent_results.append(
                 {
                     STATE_KEY: db_state.state,
-                    LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
-                        db_state.last_changed
-                    ),
+                    # Timestamps are decoded as UTC datetimes
+                    LAST_CHANGED_KEY: db_state.last_changed.isoformat(),
                 }
             )
             prev_state = db_state
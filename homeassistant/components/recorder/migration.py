@@ -579,10 +579,106 @@ def _apply_update(instance, session, new_version, old_version):  # noqa: C901
                         sum=last_statistic.sum,
                     )
                 )
+    elif new_version == 23:
+        # The state_attributes table is created by create_all, link states to it.
+        # Existing rows keep their attributes in the legacy attributes column.
+        _add_columns(connection, "states", ["attributes_id INTEGER"])
+        _create_index(connection, "states", "ix_states_attributes_id")
+    elif new_version == 24:
+        # Store timestamps as floats of seconds since the epoch
+        _add_columns(
+            connection,
+            "events",
+            ["time_fired_ts DOUBLE PRECISION", "created_ts DOUBLE PRECISION"],
+        )
+        _add_columns(
+            connection,
+            "states",
+            [
+                "last_changed_ts DOUBLE PRECISION",
+                "last_updated_ts DOUBLE PRECISION",
+                "created_ts DOUBLE PRECISION",
+            ],
+        )
+        _migrate_columns_to_timestamp(
+            connection, engine, "events", "event_id", ["time_fired", "created"]
+        )
+        _migrate_columns_to_timestamp(
+            connection,
+            engine,
+            "states",
+            "state_id",
+            ["last_changed", "last_updated", "created"],
+        )
+        _drop_index(connection, "events", "ix_events_time_fired")
+        _drop_index(connection, "events", "ix_events_event_type_time_fired")
+        _drop_index(connection, "states", "ix_states_last_updated")
+        _drop_index(connection, "states", "ix_states_entity_id_last_updated")
+        _create_index(connection, "events", "ix_events_time_fired_ts")
+        _create_index(connection, "events", "ix_events_event_type_time_fired_ts")
+        _create_index(connection, "states", "ix_states_last_updated_ts")
+        _create_index(connection, "states", "ix_states_entity_id_last_updated_ts")
+    elif new_version == 25:
+        # The state rollup tables are created by create_all
+        pass
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
 
+def _migrate_columns_to_timestamp(connection, engine, table, primary_key, columns):
+    """Copy datetime columns to their timestamp columns and clear the originals.
+
+    The original columns are cleared to reclaim the space they use since
+    they are no longer read once the timestamp columns are populated.
+    """
+    _LOGGER.warning(
+        "Converting %s of table %s to timestamps. Note: this can take several "
+        "minutes on large databases and slow computers. Please be patient!",
+        ", ".join(columns),
+        table,
+    )
+    dialect = engine.dialect.name
+    if dialect == "sqlite":
+        # SQLAlchemy stores datetimes as YYYY-MM-DD HH:MM:SS.ffffff in sqlite
+        to_timestamp = "strftime('%s', {col}) + CAST(substr({col}, 20) AS REAL)"
+    elif dialect == "mysql":
+        to_timestamp = (
+            "TIMESTAMPDIFF(MICROSECOND, '1970-01-01 00:00:00', {col}) / 1000000"
+        )
+    elif dialect == "postgresql":
+        to_timestamp = "EXTRACT(EPOCH FROM {col})"
+    else:
+        _migrate_columns_to_timestamp_row_by_row(
+            connection, table, primary_key, columns
+        )
+        return
+
+    assignments = ", ".join(
+        f"{col}_ts = {to_timestamp.format(col=col)}, {col} = NULL" for col in columns
+    )
+    connection.execute(text(f"UPDATE {table} SET {assignments}"))
+
+
+def _migrate_columns_to_timestamp_row_by_row(connection, table, primary_key, columns):
+    """Copy datetime columns to their timestamp columns for other databases."""
+    rows = connection.execute(
+        text(f"SELECT {primary_key}, {', '.join(columns)} FROM {table}")
+    ).fetchall()
+    assignments = ", ".join(f"{col}_ts = :{col}, {col} = NULL" for col in columns)
+    update = text(f"UPDATE {table} SET {assignments} WHERE {primary_key} = :row_id")
+    for row_id, *values in rows:
+        connection.execute(
+            update,
+            {
+                "row_id": row_id,
+                **{
+                    col: process_timestamp(value).timestamp() if value else None
+                    for col, value in zip(columns, values)
+                },
+            },
+        )
+
+
 def _inspect_schema_version(engine, session):
     """Determine the schema version by inspecting the db structure.
 
@@ -596,8 +692,8 @@ def _inspect_schema_version(engine, session):
     indexes = inspector.get_indexes("events")
 
     for index in indexes:
-        if index["column_names"] == ["time_fired"]:
-            # Schema addition from version 1 detected. New DB.
+        if index["column_names"] == ["time_fired_ts"]:
+            # Timestamp index from version 24 detected. New DB.
             session.add(StatisticsRuns(start=get_start_time()))
             session.add(SchemaChanges(schema_version=SCHEMA_VERSION))
             return SCHEMA_VERSION
@@ -6,8 +6,10 @@ from datetime import datetime, timedelta
 import json
 import logging
 from typing import TypedDict, overload
+import zlib
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
     DateTime,
@@ -18,6 +20,7 @@ from sqlalchemy import (
     Integer,
     String,
     Text,
+    TypeDecorator,
     distinct,
 )
 from sqlalchemy.dialects import mysql, oracle, postgresql
@@ -41,7 +44,7 @@ import homeassistant.util.dt as dt_util
 # pylint: disable=invalid-name
 Base = declarative_base()
 
-SCHEMA_VERSION = 22
+SCHEMA_VERSION = 25
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -49,15 +52,20 @@ DB_TIMEZONE = "+00:00"
 
 TABLE_EVENTS = "events"
 TABLE_STATES = "states"
+TABLE_STATE_ATTRIBUTES = "state_attributes"
 TABLE_RECORDER_RUNS = "recorder_runs"
 TABLE_SCHEMA_CHANGES = "schema_changes"
 TABLE_STATISTICS = "statistics"
 TABLE_STATISTICS_META = "statistics_meta"
 TABLE_STATISTICS_RUNS = "statistics_runs"
 TABLE_STATISTICS_SHORT_TERM = "statistics_short_term"
+TABLE_STATE_ROLLUPS_SHORT_TERM = "state_rollups_short_term"
+TABLE_STATE_ROLLUPS_HOURLY = "state_rollups_hourly"
+TABLE_STATE_ROLLUPS_DAILY = "state_rollups_daily"
 
 ALL_TABLES = [
     TABLE_STATES,
+    TABLE_STATE_ATTRIBUTES,
     TABLE_EVENTS,
     TABLE_RECORDER_RUNS,
     TABLE_SCHEMA_CHANGES,
@@ -65,6 +73,9 @@ ALL_TABLES = [
     TABLE_STATISTICS_META,
     TABLE_STATISTICS_RUNS,
     TABLE_STATISTICS_SHORT_TERM,
+    TABLE_STATE_ROLLUPS_SHORT_TERM,
+    TABLE_STATE_ROLLUPS_HOURLY,
+    TABLE_STATE_ROLLUPS_DAILY,
 ]
 
 DATETIME_TYPE = DateTime(timezone=True).with_variant(
@@ -78,13 +89,46 @@ DOUBLE_TYPE = (
 )
 
 
+class UnixTimestamp(TypeDecorator):  # pylint: disable=abstract-method
+    """A UTC datetime stored as a float of seconds since the epoch.
+
+    Floats are smaller than the DATETIME types in both rows and
+    indexes, and decoding them into a timezone aware datetime is
+    much cheaper than parsing the string representations.
+    """
+
+    impl = Float
+    cache_ok = True
+
+    def load_dialect_impl(self, dialect):
+        """Use a double precision float on all databases."""
+        return dialect.type_descriptor(DOUBLE_TYPE)
+
+    def process_bind_param(self, value, dialect):
+        """Convert a datetime to a timestamp."""
+        if value is None or isinstance(value, float):
+            return value
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=dt_util.UTC)
+        return value.timestamp()
+
+    def process_result_value(self, value, dialect):
+        """Convert a timestamp to a UTC datetime."""
+        if value is None:
+            return None
+        return datetime.fromtimestamp(value, tz=dt_util.UTC)
+
+
+TIMESTAMP_TYPE = UnixTimestamp()
+
+
 class Events(Base):  # type: ignore
     """Event history data."""
 
     __table_args__ = (
         # Used for fetching events at a specific time
         # see logbook
-        Index("ix_events_event_type_time_fired", "event_type", "time_fired"),
+        Index("ix_events_event_type_time_fired_ts", "event_type", "time_fired_ts"),
         {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
     )
     __tablename__ = TABLE_EVENTS
@@ -92,8 +136,8 @@ class Events(Base):  # type: ignore
     event_type = Column(String(MAX_LENGTH_EVENT_EVENT_TYPE))
     event_data = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
     origin = Column(String(MAX_LENGTH_EVENT_ORIGIN))
-    time_fired = Column(DATETIME_TYPE, index=True)
-    created = Column(DATETIME_TYPE, default=dt_util.utcnow)
+    time_fired = Column("time_fired_ts", TIMESTAMP_TYPE, index=True)
+    created = Column("created_ts", TIMESTAMP_TYPE, default=dt_util.utcnow)
     context_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
     context_user_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
     context_parent_id = Column(String(MAX_LENGTH_EVENT_CONTEXT_ID), index=True)
@@ -133,7 +177,7 @@ class Events(Base):  # type: ignore
                 self.event_type,
                 json.loads(self.event_data),
                 EventOrigin(self.origin),
-                process_timestamp(self.time_fired),
+                self.time_fired,
                 context=context,
             )
         except ValueError:
@@ -148,7 +192,7 @@ class States(Base):  # type: ignore
     __table_args__ = (
         # Used for fetching the state of entities at a specific time
         # (get_states in history.py)
-        Index("ix_states_entity_id_last_updated", "entity_id", "last_updated"),
+        Index("ix_states_entity_id_last_updated_ts", "entity_id", "last_updated_ts"),
         {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
     )
     __tablename__ = TABLE_STATES
@@ -160,12 +204,18 @@ class States(Base):  # type: ignore
     event_id = Column(
         Integer, ForeignKey("events.event_id", ondelete="CASCADE"), index=True
     )
-    last_changed = Column(DATETIME_TYPE, default=dt_util.utcnow)
-    last_updated = Column(DATETIME_TYPE, default=dt_util.utcnow, index=True)
-    created = Column(DATETIME_TYPE, default=dt_util.utcnow)
+    last_changed = Column("last_changed_ts", TIMESTAMP_TYPE, default=dt_util.utcnow)
+    last_updated = Column(
+        "last_updated_ts", TIMESTAMP_TYPE, default=dt_util.utcnow, index=True
+    )
+    created = Column("created_ts", TIMESTAMP_TYPE, default=dt_util.utcnow)
     old_state_id = Column(Integer, ForeignKey("states.state_id"), index=True)
+    attributes_id = Column(
+        Integer, ForeignKey("state_attributes.attributes_id"), index=True
+    )
     event = relationship("Events", uselist=False)
     old_state = relationship("States", remote_side=[state_id])
+    state_attributes = relationship("StateAttributes")
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
@@ -174,13 +224,17 @@ class States(Base):  # type: ignore
             f"id={self.state_id}, domain='{self.domain}', entity_id='{self.entity_id}', "
             f"state='{self.state}', event_id='{self.event_id}', "
             f"last_updated='{self.last_updated.isoformat(sep=' ', timespec='seconds')}', "
-            f"old_state_id={self.old_state_id}"
+            f"old_state_id={self.old_state_id}, attributes_id={self.attributes_id}"
             f")>"
         )
 
     @staticmethod
     def from_event(event):
-        """Create object from a state_changed event."""
+        """Create object from a state_changed event.
+
+        The attributes are not stored on the row, they are shared
+        through the state_attributes table, see StateAttributes.
+        """
         entity_id = event.data["entity_id"]
         state = event.data.get("new_state")
 
@@ -190,15 +244,11 @@ class States(Base):  # type: ignore
         if state is None:
             dbstate.state = ""
             dbstate.domain = split_entity_id(entity_id)[0]
-            dbstate.attributes = "{}"
             dbstate.last_changed = event.time_fired
             dbstate.last_updated = event.time_fired
         else:
             dbstate.domain = state.domain
             dbstate.state = state.state
-            dbstate.attributes = json.dumps(
-                dict(state.attributes), cls=JSONEncoder, separators=(",", ":")
-            )
             dbstate.last_changed = state.last_changed
             dbstate.last_updated = state.last_updated
 
@@ -206,13 +256,18 @@ class States(Base):  # type: ignore
 
     def to_native(self, validate_entity_id=True):
         """Convert to an HA state object."""
+        # Rows written before schema version 23 carry their
+        # attributes inline in the legacy attributes column
+        shared_attrs = self.attributes
+        if shared_attrs is None and self.state_attributes is not None:
+            shared_attrs = self.state_attributes.shared_attrs
         try:
             return State(
                 self.entity_id,
                 self.state,
-                json.loads(self.attributes),
-                process_timestamp(self.last_changed),
-                process_timestamp(self.last_updated),
+                json.loads(shared_attrs) if shared_attrs else {},
+                self.last_changed,
+                self.last_updated,
                 # Join the events table on event_id to get the context instead
                 # as it will always be there for state_changed events
                 context=Context(id=None),
@@ -224,6 +279,65 @@ class States(Base):  # type: ignore
             return None
 
 
+class StateAttributes(Base):  # type: ignore
+    """State attribute change history.
+
+    Identical attribute sets are stored once and shared by all
+    states rows referencing them through attributes_id.
+    """
+
+    __table_args__ = (
+        {"mysql_default_charset": "utf8mb4", "mysql_collate": "utf8mb4_unicode_ci"},
+    )
+    __tablename__ = TABLE_STATE_ATTRIBUTES
+    attributes_id = Column(Integer, Identity(), primary_key=True)
+    hash = Column(BigInteger, index=True)
+    # Note that this is not named attributes to avoid confusion with the states table
+    shared_attrs = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
+
+    def __repr__(self) -> str:
+        """Return string representation of instance for debugging."""
+        return (
+            f"<recorder.StateAttributes("
+            f"id={self.attributes_id}, hash='{self.hash}', attributes='{self.shared_attrs}'"
+            f")>"
+        )
+
+    @staticmethod
+    def from_event(event):
+        """Create object from a state_changed event."""
+        shared_attrs = StateAttributes.shared_attrs_from_event(event)
+        return StateAttributes(
+            shared_attrs=shared_attrs,
+            hash=StateAttributes.hash_shared_attrs(shared_attrs),
+        )
+
+    @staticmethod
+    def shared_attrs_from_event(event) -> str:
+        """Create shared_attrs from a state_changed event."""
+        state = event.data.get("new_state")
+        # State got deleted
+        if state is None:
+            return "{}"
+        return json.dumps(
+            dict(state.attributes), cls=JSONEncoder, separators=(",", ":")
+        )
+
+    @staticmethod
+    def hash_shared_attrs(shared_attrs: str) -> int:
+        """Return the hash of json encoded shared attributes."""
+        return zlib.crc32(shared_attrs.encode("utf-8"))
+
+    def to_native(self):
+        """Convert to an HA state object."""
+        try:
+            return json.loads(self.shared_attrs)
+        except ValueError:
+            # When json.loads fails
+            _LOGGER.exception("Error converting row to state attributes: %s", self)
+            return {}
+
+
 class StatisticResult(TypedDict):
     """Statistic result data class.
 
@@ -432,6 +546,70 @@ class StatisticsRuns(Base):  # type: ignore
         )
 
 
+class StateRollupData(TypedDict):
+    """State rollup data class."""
+
+    entity_id: str
+    start: datetime
+    mean: float
+    min: float
+    max: float
+    last: float | None
+    seconds: float
+
+
+class StateRollupsBase:
+    """Downsampled numeric states base class."""
+
+    duration: timedelta
+
+    id = Column(Integer, Identity(), primary_key=True)
+    entity_id = Column(String(MAX_LENGTH_STATE_ENTITY_ID))
+    start = Column(TIMESTAMP_TYPE)
+    mean = Column(DOUBLE_TYPE)
+    min = Column(DOUBLE_TYPE)
+    max = Column(DOUBLE_TYPE)
+    last = Column(DOUBLE_TYPE)
+    seconds = Column(DOUBLE_TYPE)
+
+    @declared_attr
+    def __table_args__(cls):  # pylint: disable=no-self-argument
+        """Index rollups for fetching an entity over a period of time."""
+        return (
+            Index(
+                f"ix_{cls.__tablename__}_entity_id_start",  # type: ignore[attr-defined]
+                "entity_id",
+                "start",
+            ),
+        )
+
+    @classmethod
+    def from_rollup(cls, rollup: StateRollupData):
+        """Create object from a rollup."""
+        return cls(**rollup)  # type: ignore
+
+
+class StateRollupsShortTerm(Base, StateRollupsBase):  # type: ignore
+    """5-minute rollups of numeric states."""
+
+    duration = timedelta(minutes=5)
+    __tablename__ = TABLE_STATE_ROLLUPS_SHORT_TERM
+
+
+class StateRollupsHourly(Base, StateRollupsBase):  # type: ignore
+    """Hourly rollups of numeric states."""
+
+    duration = timedelta(hours=1)
+    __tablename__ = TABLE_STATE_ROLLUPS_HOURLY
+
+
+class StateRollupsDaily(Base, StateRollupsBase):  # type: ignore
+    """Daily rollups of numeric states."""
+
+    duration = timedelta(days=1)
+    __tablename__ = TABLE_STATE_ROLLUPS_DAILY
+
+
 @overload
 def process_timestamp(ts: None) -> None:
     ...
@@ -501,7 +679,9 @@ class LazyState(State):
         """State attributes."""
         if not self._attributes:
             try:
-                self._attributes = json.loads(self._row.attributes)
+                self._attributes = json.loads(
+                    self._row.shared_attrs or self._row.attributes
+                )
             except ValueError:
                 # When json.loads fails
                 _LOGGER.exception("Error converting row to state: %s", self._row)
@@ -529,7 +709,7 @@ class LazyState(State):
     def last_changed(self):
         """Last changed datetime."""
         if not self._last_changed:
-            self._last_changed = process_timestamp(self._row.last_changed)
+            self._last_changed = self._row.last_changed
         return self._last_changed
 
     @last_changed.setter
@@ -541,7 +721,7 @@ class LazyState(State):
     def last_updated(self):
         """Last updated datetime."""
         if not self._last_updated:
-            self._last_updated = process_timestamp(self._row.last_updated)
+            self._last_updated = self._row.last_updated
         return self._last_updated
 
     @last_updated.setter
@@ -556,18 +736,8 @@ class LazyState(State):
 
         To be used for JSON serialization.
         """
-        if self._last_changed:
-            last_changed_isoformat = self._last_changed.isoformat()
-        else:
-            last_changed_isoformat = process_timestamp_to_utc_isoformat(
-                self._row.last_changed
-            )
-        if self._last_updated:
-            last_updated_isoformat = self._last_updated.isoformat()
-        else:
-            last_updated_isoformat = process_timestamp_to_utc_isoformat(
-                self._row.last_updated
-            )
+        last_changed_isoformat = self.last_changed.isoformat()
+        last_updated_isoformat = self.last_updated.isoformat()
         return {
             "entity_id": self.entity_id,
             "state": self.state,
@@ -576,6 +746,10 @@ class LazyState(State):
             "last_updated": last_updated_isoformat,
         }
 
+    def as_json(self):
+        """Return a JSON string of the LazyState."""
+        return json.dumps(self.as_dict(), allow_nan=False)
+
     def __eq__(self, other):
         """Return the comparison."""
         return (
@@ -6,11 +6,18 @@ from datetime import datetime
 import logging
 from typing import TYPE_CHECKING
 
+from sqlalchemy import select
 from sqlalchemy.orm.session import Session
 from sqlalchemy.sql.expression import distinct
 
-from .const import MAX_ROWS_TO_PURGE
-from .models import Events, RecorderRuns, States
+from .const import MAX_IDS_PER_PURGE_CHUNK, MAX_ROWS_TO_PURGE
+from .models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    StateRollupsShortTerm,
+    States,
+)
 from .repack import repack_database
 from .util import retryable_database_job, session_scope
 
@@ -26,7 +33,8 @@ def purge_old_data(
 ) -> bool:
     """Purge events and states older than purge_before.
 
-    Cleans up an timeframe of an hour, based on the oldest record.
+    Cleans up a chunk of MAX_IDS_PER_PURGE_CHUNK event ids per pass, starting
+    at the oldest record.
     """
     _LOGGER.debug(
         "Purging states and events before target %s",
@@ -34,14 +42,12 @@ def purge_old_data(
     )
 
     with session_scope(session=instance.get_session()) as session:  # type: ignore
-        # Purge a max of MAX_ROWS_TO_PURGE, based on the oldest states or events record
-        event_ids = _select_event_ids_to_purge(session, purge_before)
-        state_ids = _select_state_ids_to_purge(session, purge_before, event_ids)
-        if state_ids:
-            _purge_state_ids(instance, session, state_ids)
-
-        if event_ids:
-            _purge_event_ids(session, event_ids)
+        # Purge a chunk of event ids, based on the oldest events record
+        if event_id_range := _select_event_id_range_to_purge(session, purge_before):
+            _purge_states_in_event_id_range(
+                instance, session, purge_before, event_id_range
+            )
+            _purge_events_in_event_id_range(session, purge_before, event_id_range)
             # If states or events purging isn't processing the purge_before yet,
             # return false, as we are not done yet.
             _LOGGER.debug("Purging hasn't fully completed yet")
@@ -50,41 +56,109 @@ def purge_old_data(
             _LOGGER.debug("Cleanup filtered data hasn't fully completed yet")
             return False
         _purge_old_recorder_runs(instance, session, purge_before)
+        _purge_old_short_term_rollups(session, purge_before)
     if repack:
         repack_database(instance)
     return True
 
 
-def _select_event_ids_to_purge(session: Session, purge_before: datetime) -> list[int]:
-    """Return a list of event ids to purge."""
-    events = (
-        session.query(Events.event_id)
-        .filter(Events.time_fired < purge_before)
-        .limit(MAX_ROWS_TO_PURGE)
+def _select_event_id_range_to_purge(
+    session: Session, purge_before: datetime
+) -> tuple[int, int] | None:
+    """Return the range of event ids to purge in this pass."""
+    # Event ids grow with time, so the chunk normally starts at the lowest id.
+    # Events recorded out of order are found through the time_fired index.
+    oldest_event = (
+        session.query(Events.event_id, Events.time_fired)
+        .order_by(Events.event_id)
+        .first()
+    )
+    if oldest_event is None:
+        return None
+    if oldest_event.time_fired is None or oldest_event.time_fired >= purge_before:
+        oldest_event = (
+            session.query(Events.event_id, Events.time_fired)
+            .filter(Events.time_fired < purge_before)
+            .order_by(Events.time_fired)
+            .first()
+        )
+        if oldest_event is None:
+            return None
+    first_event_id = oldest_event.event_id
+    last_event_id = first_event_id + MAX_IDS_PER_PURGE_CHUNK - 1
+    _LOGGER.debug("Selected event ids %s-%s to remove", first_event_id, last_event_id)
+    return first_event_id, last_event_id
+
+
+def _purge_states_in_event_id_range(
+    instance: Recorder,
+    session: Session,
+    purge_before: datetime,
+    event_id_range: tuple[int, int],
+) -> None:
+    """Disconnect and delete the expired states linked to a range of event ids."""
+    states_in_range = (
+        session.query(States)
+        .filter(States.event_id.between(*event_id_range))
+        .filter(States.last_updated < purge_before)
+    )
+    attributes_ids = {
+        attributes_id
+        for (attributes_id,) in states_in_range.with_entities(
+            distinct(States.attributes_id)
+        )
+        .filter(States.attributes_id.isnot(None))
         .all()
+    }
+
+    # Update old_state_id to NULL before deleting to ensure
+    # the delete does not fail due to a foreign key constraint
+    # since some databases (MSSQL) cannot do the ON DELETE SET NULL
+    # for us. The purged state ids are wrapped in a derived table
+    # as MySQL can't select from the table it updates.
+    purged_state_ids = states_in_range.with_entities(States.state_id).subquery()
+    disconnected_rows = (
+        session.query(States)
+        .filter(States.old_state_id.in_(select(purged_state_ids.c.state_id)))
+        .update({"old_state_id": None}, synchronize_session=False)
     )
-    _LOGGER.debug("Selected %s event ids to remove", len(events))
-    return [event.event_id for event in events]
+    _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
 
+    deleted_rows = states_in_range.delete(synchronize_session=False)
+    _LOGGER.debug("Deleted %s states", deleted_rows)
+    if not deleted_rows:
+        return
 
-def _select_state_ids_to_purge(
-    session: Session, purge_before: datetime, event_ids: list[int]
-) -> set[int]:
-    """Return a list of state ids to purge."""
-    if not event_ids:
-        return set()
-    states = (
-        session.query(States.state_id)
-        .filter(States.last_updated < purge_before)
-        .filter(States.event_id.in_(event_ids))
-        .all()
+    # Evict eny entries in the old_states cache referring to a purged state
+    old_states = instance._old_states  # pylint: disable=protected-access
+    for entity_id, old_state in list(old_states.items()):
+        if (
+            old_state.event_id is not None
+            and event_id_range[0] <= old_state.event_id <= event_id_range[1]
+            and old_state.last_updated < purge_before
+        ):
+            del old_states[entity_id]
+
+    if unused_attributes_ids := _select_unused_attributes_ids(session, attributes_ids):
+        _purge_attributes_ids(instance, session, unused_attributes_ids)
+
+
+def _purge_events_in_event_id_range(
+    session: Session, purge_before: datetime, event_id_range: tuple[int, int]
+) -> None:
+    """Delete the expired events in a range of event ids."""
+    deleted_rows = (
+        session.query(Events)
+        .filter(Events.event_id.between(*event_id_range))
+        .filter(Events.time_fired < purge_before)
+        .delete(synchronize_session=False)
     )
-    _LOGGER.debug("Selected %s state ids to remove", len(states))
-    return {state.state_id for state in states}
+    _LOGGER.debug("Deleted %s events", deleted_rows)
 
 
 def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int]) -> None:
     """Disconnect states and delete by state id."""
+    attributes_ids = _select_attributes_ids_for_state_ids(session, state_ids)
 
     # Update old_state_id to NULL before deleting to ensure
     # the delete does not fail due to a foreign key constraint
@@ -107,6 +181,77 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     # Evict eny entries in the old_states cache referring to a purged state
     _evict_purged_states_from_old_states_cache(instance, state_ids)
 
+    if unused_attributes_ids := _select_unused_attributes_ids(session, attributes_ids):
+        _purge_attributes_ids(instance, session, unused_attributes_ids)
+
+
+def _select_attributes_ids_for_state_ids(
+    session: Session, state_ids: set[int]
+) -> set[int]:
+    """Return the attributes ids referenced by the given states."""
+    attributes = (
+        session.query(distinct(States.attributes_id))
+        .filter(States.state_id.in_(state_ids))
+        .filter(States.attributes_id.isnot(None))
+        .all()
+    )
+    return {attributes_id for (attributes_id,) in attributes}
+
+
+def _select_unused_attributes_ids(
+    session: Session, attributes_ids: set[int]
+) -> set[int]:
+    """Return the attributes ids that are no longer referenced by any state."""
+    if not attributes_ids:
+        return set()
+    seen_ids: set[int] = set()
+    candidate_ids = list(attributes_ids)
+    for idx in range(0, len(candidate_ids), MAX_ROWS_TO_PURGE):
+        seen_ids.update(
+            attributes_id
+            for (attributes_id,) in session.query(distinct(States.attributes_id))
+            .filter(
+                States.attributes_id.in_(candidate_ids[idx : idx + MAX_ROWS_TO_PURGE])
+            )
+            .all()
+        )
+    unused_ids = attributes_ids - seen_ids
+    _LOGGER.debug("Selected %s shared attributes to remove", len(unused_ids))
+    return unused_ids
+
+
+def _purge_attributes_ids(
+    instance: Recorder, session: Session, attributes_ids: set[int]
+) -> None:
+    """Delete old attributes ids."""
+    purge_ids = list(attributes_ids)
+    for idx in range(0, len(purge_ids), MAX_ROWS_TO_PURGE):
+        deleted_rows = (
+            session.query(StateAttributes)
+            .filter(
+                StateAttributes.attributes_id.in_(
+                    purge_ids[idx : idx + MAX_ROWS_TO_PURGE]
+                )
+            )
+            .delete(synchronize_session=False)
+        )
+        _LOGGER.debug("Deleted %s attribute states", deleted_rows)
+
+    # Evict any entries in the state_attributes_ids cache referring to a purged state
+    _evict_purged_attributes_from_attributes_cache(instance, attributes_ids)
+
+
+def _evict_purged_attributes_from_attributes_cache(
+    instance: Recorder, purged_attributes_ids: set[int]
+) -> None:
+    """Evict purged attribute ids from the attribute ids cache."""
+    state_attributes_ids = (
+        instance._state_attributes_ids  # pylint: disable=protected-access
+    )
+    for shared_attrs, attributes_id in list(state_attributes_ids.items()):
+        if attributes_id in purged_attributes_ids:
+            del state_attributes_ids[shared_attrs]
+
 
 def _evict_purged_states_from_old_states_cache(
     instance: Recorder, purged_state_ids: set[int]
@@ -149,6 +294,17 @@ def _purge_old_recorder_runs(
     _LOGGER.debug("Deleted %s recorder_runs", deleted_rows)
 
 
+def _purge_old_short_term_rollups(session: Session, purge_before: datetime) -> None:
+    """Purge 5-minute rollups of states which have been purged."""
+    # Hourly and daily rollups are kept for long-range history
+    deleted_rows = (
+        session.query(StateRollupsShortTerm)
+        .filter(StateRollupsShortTerm.start < purge_before)
+        .delete(synchronize_session=False)
+    )
+    _LOGGER.debug("Deleted %s short term rollups", deleted_rows)
+
+
 def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     """Remove filtered states and events that shouldn't be in the database."""
     _LOGGER.debug("Cleanup filtered data")
@@ -0,0 +1,263 @@
+"""Downsampled history of numeric states."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import datetime, timedelta
+from itertools import groupby
+from typing import Any
+
+from sqlalchemy.orm.scoping import scoped_session
+
+from .accumulators import NumericStateAccumulator, StateAccumulators, float_or_none
+from .models import (
+    StateRollupData,
+    StateRollupsBase,
+    StateRollupsDaily,
+    StateRollupsHourly,
+    StateRollupsShortTerm,
+    States,
+)
+from .util import execute
+
+# Rollup tiers, from the finest to the coarsest
+ROLLUP_TIERS: tuple[type[StateRollupsBase], ...] = (
+    StateRollupsShortTerm,
+    StateRollupsHourly,
+    StateRollupsDaily,
+)
+
+# Periods which fit in the point budget at this resolution are served from the
+# raw states, longer periods from the finest rollup tier fitting the budget.
+RAW_STATES_RESOLUTION = timedelta(minutes=1)
+
+
+def _summarize_states(
+    entity_id: str,
+    start: datetime,
+    end: datetime,
+    initial: float | None,
+    states: Iterable[Any],
+) -> StateRollupData | None:
+    """Summarize the states of an entity during a period.
+
+    The mean is weighted by how long each numeric value was valid. The value
+    known when the period starts is valid until the first state of the period.
+    Non-numeric states are skipped like in the statistics of the period, but
+    the value before them is not carried into the next period.
+    """
+    value, time = initial, start
+    last = initial
+    values: list[float] = []
+    weighted_sum = 0.0
+    seconds = 0.0
+    for index, row in enumerate([*states, None]):
+        next_time = end if row is None else row.last_updated
+        duration = (next_time - time).total_seconds()
+        # The initial value is ignored if it is replaced right at the start
+        if value is not None and (index or duration):
+            weighted_sum += value * duration
+            seconds += duration
+            values.append(value)
+        if row is not None:
+            time = next_time
+            if (last := float_or_none(row.state)) is not None:
+                value = last
+    if not values:
+        return None
+    return {
+        "entity_id": entity_id,
+        "start": start,
+        "mean": weighted_sum / seconds if seconds else sum(values) / len(values),
+        "min": min(values),
+        "max": max(values),
+        "last": last,
+        "seconds": seconds,
+    }
+
+
+def _summarize_accumulated(
+    entity_id: str, start: datetime, end: datetime, summary: NumericStateAccumulator
+) -> StateRollupData:
+    """Summarize an entity from the states accumulated by the recorder."""
+    return {
+        "entity_id": entity_id,
+        "start": start,
+        "mean": summary.time_weighted_mean(end),
+        "min": summary.min,
+        "max": summary.max,
+        "last": None if summary.stopped else summary.last_value,
+        "seconds": (end - summary.first_time).total_seconds(),
+    }
+
+
+def _summarize_history(
+    session: scoped_session, start: datetime, end: datetime
+) -> list[StateRollupData]:
+    """Summarize all entities from the states recorded during a period."""
+    previous = execute(
+        session.query(StateRollupsShortTerm.entity_id, StateRollupsShortTerm.last)
+        .filter(StateRollupsShortTerm.start == start - StateRollupsShortTerm.duration)
+        .filter(StateRollupsShortTerm.last.isnot(None))
+    )
+    initial_values: dict[str, float] = {
+        row.entity_id: row.last for row in previous or []
+    }
+    states = execute(
+        session.query(States.entity_id, States.state, States.last_updated)
+        .filter(States.last_updated >= start)
+        .filter(States.last_updated < end)
+        .filter(States.state.isnot(None))
+        .order_by(States.entity_id, States.last_updated)
+    )
+    states_by_entity = {
+        entity_id: list(group)
+        for entity_id, group in groupby(states or [], lambda row: row.entity_id)
+    }
+    rollups = []
+    for entity_id in sorted(initial_values.keys() | states_by_entity.keys()):
+        if rollup := _summarize_states(
+            entity_id,
+            start,
+            end,
+            initial_values.get(entity_id),
+            states_by_entity.get(entity_id, []),
+        ):
+            rollups.append(rollup)
+    return rollups
+
+
+def _summarize_rollups(
+    entity_id: str, start: datetime, rollups: Iterable[Any]
+) -> StateRollupData:
+    """Summarize rollups of an entity from a finer tier, weighted by duration."""
+    rollups = list(rollups)
+    seconds = sum(rollup.seconds or 0.0 for rollup in rollups)
+    if seconds:
+        mean = (
+            sum(rollup.mean * (rollup.seconds or 0.0) for rollup in rollups) / seconds
+        )
+    else:
+        mean = sum(rollup.mean for rollup in rollups) / len(rollups)
+    return {
+        "entity_id": entity_id,
+        "start": start,
+        "mean": mean,
+        "min": min(rollup.min for rollup in rollups),
+        "max": max(rollup.max for rollup in rollups),
+        "last": rollups[-1].last,
+        "seconds": seconds,
+    }
+
+
+def _compile_tier_from_finer_tier(
+    session: scoped_session,
+    source: type[StateRollupsBase],
+    target: type[StateRollupsBase],
+    start: datetime,
+) -> None:
+    """Compile rollups of a tier for the period starting at start."""
+    end = start + target.duration
+    rows = execute(
+        session.query(
+            source.entity_id,
+            source.mean,
+            source.min,
+            source.max,
+            source.last,
+            source.seconds,
+        )
+        .filter(source.start >= start)
+        .filter(source.start < end)
+        .order_by(source.entity_id, source.start)
+    )
+    if not rows:
+        return
+    for entity_id, group in groupby(rows, lambda row: row.entity_id):
+        session.add(target.from_rollup(_summarize_rollups(entity_id, start, group)))
+
+
+def compile_rollups(
+    session: scoped_session, start: datetime, accumulators: StateAccumulators
+) -> None:
+    """Compile rollups of all numeric entities for the 5-minute period at start.
+
+    The rollups are summarized from the states accumulated by the recorder if
+    it recorded the whole period, else from the states in the database. The
+    last value of the previous period is carried into the period, so entities
+    with a stable numeric state get a rollup for every period.
+    Hourly and daily rollups are summarized from the finer tier once the last
+    5-minute period of an hour or a day has been compiled.
+    """
+    end = start + StateRollupsShortTerm.duration
+    if accumulators.covers(start):
+        rollups = [
+            _summarize_accumulated(entity_id, start, end, summary)
+            for entity_id, summary in accumulators.summarize_all(start).items()
+        ]
+    else:
+        rollups = _summarize_history(session, start, end)
+    for rollup in rollups:
+        session.add(StateRollupsShortTerm.from_rollup(rollup))
+
+    if end.minute == 0:
+        _compile_tier_from_finer_tier(
+            session,
+            StateRollupsShortTerm,
+            StateRollupsHourly,
+            end - StateRollupsHourly.duration,
+        )
+    if end.minute == 0 and end.hour == 0:
+        _compile_tier_from_finer_tier(
+            session,
+            StateRollupsHourly,
+            StateRollupsDaily,
+            end - StateRollupsDaily.duration,
+        )
+
+
+def rollup_tier_for_period(
+    start_time: datetime, end_time: datetime, max_points: int
+) -> type[StateRollupsBase] | None:
+    """Return the finest rollup tier fitting max_points, or None for raw states."""
+    span = end_time - start_time
+    if span <= RAW_STATES_RESOLUTION * max_points:
+        return None
+    for tier in ROLLUP_TIERS:
+        if span <= tier.duration * max_points:
+            return tier
+    return ROLLUP_TIERS[-1]
+
+
+def get_rollups_with_session(
+    session: scoped_session,
+    tier: type[StateRollupsBase],
+    start_time: datetime,
+    end_time: datetime,
+    entity_ids: list[str],
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the rollups of a tier during a period, keyed by entity_id.
+
+    The rollups are in the format of a minimal history response, the state
+    is the mean over the period, min and max are added alongside.
+    """
+    rows = execute(
+        session.query(tier.entity_id, tier.start, tier.mean, tier.min, tier.max)
+        .filter(tier.entity_id.in_(entity_ids))
+        .filter(tier.start >= start_time)
+        .filter(tier.start < end_time)
+        .order_by(tier.entity_id, tier.start)
+    )
+    if not rows:
+        return {}
+    return {
+        entity_id: [
+            {
+                "state": str(row.mean),
+                "last_changed": row.start.isoformat(),
+                "min": row.min,
+                "max": row.max,
+            }
+            for row in group
+        ]
+        for entity_id, group in groupby(rows, lambda row: row.entity_id)
+    }
@@ -41,6 +41,7 @@ from .models import (
     process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
+from .rollups import compile_rollups
 from .util import execute, retryable_database_job, session_scope
 
 if TYPE_CHECKING:
@@ -408,6 +409,9 @@ def compile_statistics(instance: Recorder, start: datetime) -> bool:
             # A full hour is ready, summarize it
             compile_hourly_statistics(instance, session, start)
 
+        # Downsample the history of all numeric entities
+        compile_rollups(session, start, instance.state_accumulators)
+
         session.add(StatisticsRuns(start=start))
 
     return True
@@ -597,7 +601,7 @@ def statistics_during_period(
     If statistic_ids is omitted, returns statistics for all statistics ids.
     """
     metadata = None
-    with session_scope(hass=hass) as session:
+    with session_scope(hass=hass, read_only=True) as session:
         # Fetch metadata for the given (or all) statistic_ids
         metadata = get_metadata_with_session(hass, session, statistic_ids, None)
         if not metadata:
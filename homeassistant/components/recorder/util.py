@@ -53,11 +53,22 @@ RETRYABLE_MYSQL_ERRORS = (1205, 1206, 1213)
 
 @contextmanager
 def session_scope(
-    *, hass: HomeAssistant | None = None, session: Session | None = None
+    *,
+    hass: HomeAssistant | None = None,
+    session: Session | None = None,
+    read_only: bool = False,
 ) -> Generator[Session, None, None]:
-    """Provide a transactional scope around a series of operations."""
+    """Provide a transactional scope around a series of operations.
+
+    With read_only the session comes from the recorder's read pool
+    which is kept apart from the connection used to write events.
+    """
     if session is None and hass is not None:
-        session = hass.data[DATA_INSTANCE].get_session()
+        instance = hass.data[DATA_INSTANCE]
+        if read_only:
+            session = instance.get_read_session()
+        else:
+            session = instance.get_session()
 
     if session is None:
         raise RuntimeError("Session required")
@@ -319,6 +330,28 @@ def setup_connection_for_dialect(
                 )
 
 
+def setup_read_only_connection_for_dialect(dialect_name, dbapi_connection):
+    """Execute statements needed for a read only dialect connection."""
+    if dialect_name == "sqlite":
+        # approximately 8MiB of memory
+        execute_on_connection(dbapi_connection, "PRAGMA cache_size = -8192")
+
+        # WAL mode lets readers run alongside the recorder writer,
+        # refuse writes so they can only come from the recorder
+        execute_on_connection(dbapi_connection, "PRAGMA query_only = ON")
+
+    if dialect_name == "mysql":
+        execute_on_connection(dbapi_connection, "SET session wait_timeout=28800")
+        execute_on_connection(dbapi_connection, "SET SESSION TRANSACTION READ ONLY")
+
+    if dialect_name == "postgresql":
+        # Settings changed in a rolled back transaction are undone, commit it
+        execute_on_connection(
+            dbapi_connection, "SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY"
+        )
+        dbapi_connection.commit()
+
+
 def end_incomplete_runs(session, start_time):
     """End any incomplete recorder runs."""
     for run in session.query(RecorderRuns).filter_by(end=None):
@@ -17,6 +17,7 @@ from homeassistant.components.recorder import (
     statistics,
     util as recorder_util,
 )
+from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     StatisticData,
     StatisticMetaData,
@@ -388,6 +389,51 @@ def _last_reset_as_utc_isoformat(last_reset_s: Any, entity_id: str) -> str | Non
     return dt_util.as_utc(last_reset).isoformat()
 
 
+def _accumulated_statistics(
+    hass: HomeAssistant,
+    sensor_states: list[State],
+    wanted_statistics: dict[str, set[str]],
+    start: datetime.datetime,
+    end: datetime.datetime,
+) -> dict[str, tuple[str | None, dict[str, float]]]:
+    """Return the wanted mean, min and max of measurements summarized by the recorder.
+
+    Entities which can't be summarized, for example because their unit changed
+    during the period, are left to be compiled from their history.
+    """
+    accumulators = hass.data[DATA_INSTANCE].state_accumulators
+    if not accumulators.covers(start):
+        return {}
+
+    device_classes = {
+        state.entity_id: state.attributes.get(ATTR_DEVICE_CLASS)
+        for state in sensor_states
+        if "sum" not in wanted_statistics[state.entity_id]
+    }
+    result = {}
+    for entity_id, summary in accumulators.summarize_period(
+        start, list(device_classes)
+    ).items():
+        if len(summary.units) != 1:
+            continue
+        unit = next(iter(summary.units))
+        convert: Callable[[float], float] = lambda x: x
+        if (device_class := device_classes[entity_id]) in UNIT_CONVERSIONS:
+            if unit not in UNIT_CONVERSIONS[device_class]:
+                continue
+            convert = UNIT_CONVERSIONS[device_class][unit]
+            unit = DEVICE_CLASS_UNITS[device_class]
+        stat: dict[str, float] = {}
+        if "max" in wanted_statistics[entity_id]:
+            stat["max"] = convert(summary.max)
+        if "min" in wanted_statistics[entity_id]:
+            stat["min"] = convert(summary.min)
+        if "mean" in wanted_statistics[entity_id]:
+            stat["mean"] = convert(summary.time_weighted_mean(end))
+        result[entity_id] = (unit, stat)
+    return result
+
+
 def compile_statistics(
     hass: HomeAssistant, start: datetime.datetime, end: datetime.datetime
 ) -> list[StatisticResult]:
@@ -415,6 +461,11 @@ def _compile_statistics(  # noqa: C901
         hass, session, [i.entity_id for i in sensor_states], None
     )
 
+    # Measurements summarized while the recorder wrote their states
+    accumulated_statistics = _accumulated_statistics(
+        hass, sensor_states, wanted_statistics, start, end
+    )
+
     # Get history between start and end
     entities_full_history = [
         i.entity_id for i in sensor_states if "sum" in wanted_statistics[i.entity_id]
@@ -433,6 +484,7 @@ def _compile_statistics(  # noqa: C901
         i.entity_id
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
+        and i.entity_id not in accumulated_statistics
     ]
     if entities_significant_history:
         _history_list = history.get_significant_states_with_session(  # type: ignore
@@ -446,23 +498,31 @@ def _compile_statistics(  # noqa: C901
     # If there are no recent state changes, the sensor's state may already be pruned
     # from the recorder. Get the state from the state machine instead.
     for _state in sensor_states:
-        if _state.entity_id not in history_list:
+        if (
+            _state.entity_id not in history_list
+            and _state.entity_id not in accumulated_statistics
+        ):
             history_list[_state.entity_id] = (_state,)
 
     for _state in sensor_states:  # pylint: disable=too-many-nested-blocks
         entity_id = _state.entity_id
-        if entity_id not in history_list:
+        if entity_id in accumulated_statistics:
+            unit, accumulated_stat = accumulated_statistics[entity_id]
+        elif entity_id in history_list:
+            accumulated_stat = None
+        else:
             continue
 
         state_class = _state.attributes[ATTR_STATE_CLASS]
         device_class = _state.attributes.get(ATTR_DEVICE_CLASS)
-        entity_history = history_list[entity_id]
-        unit, fstates = _normalize_states(
-            hass, session, old_metadatas, entity_history, device_class, entity_id
-        )
+        if accumulated_stat is None:
+            entity_history = history_list[entity_id]
+            unit, fstates = _normalize_states(
+                hass, session, old_metadatas, entity_history, device_class, entity_id
+            )
 
-        if not fstates:
-            continue
+            if not fstates:
+                continue
 
         # Check metadata
         if old_metadata := old_metadatas.get(entity_id):
@@ -493,6 +553,11 @@ def _compile_statistics(  # noqa: C901
 
         # Make calculations
         stat: StatisticData = {"start": start}
+        if accumulated_stat is not None:
+            stat.update(accumulated_stat)  # type: ignore[typeddict-item]
+            result.append({"meta": meta, "stat": (stat,)})
+            continue
+
         if "max" in wanted_statistics[entity_id]:
             stat["max"] = max(*itertools.islice(zip(*fstates), 1))  # type: ignore[typeddict-item]
         if "min" in wanted_statistics[entity_id]:
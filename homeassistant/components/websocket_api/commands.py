@@ -12,7 +12,7 @@ from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_READ
 from homeassistant.bootstrap import SIGNAL_BOOTSTRAP_INTEGRATONS
 from homeassistant.components.websocket_api.const import ERR_NOT_FOUND
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL
-from homeassistant.core import Context, Event, HomeAssistant, callback
+from homeassistant.core import Context, Event, HomeAssistant, State, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
@@ -24,6 +24,7 @@ from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
+    async_track_state_change_event,
     async_track_template_result,
 )
 from homeassistant.helpers.json import ExtendedJSONEncoder
@@ -34,6 +35,10 @@ from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
 from . import const, decorators, messages
 from .connection import ActiveConnection
 
+# How long changes of entities are collected before they are sent to
+# subscribe_entities subscribers
+SUBSCRIBE_ENTITIES_COALESCE_DELAY = 0.1
+
 
 @callback
 def async_register_commands(
@@ -53,8 +58,10 @@ def async_register_commands(
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_bootstrap_integrations)
+    async_reg(hass, handle_subscribe_entities)
     async_reg(hass, handle_subscribe_events)
     async_reg(hass, handle_subscribe_trigger)
+    async_reg(hass, handle_supported_features)
     async_reg(hass, handle_test_condition)
     async_reg(hass, handle_unsubscribe_events)
 
@@ -113,6 +120,101 @@ def handle_subscribe_events(
     connection.send_message(messages.result_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "subscribe_entities",
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+def handle_subscribe_entities(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle subscribe entities command.
+
+    Sends the compressed states of the entities, followed by the differences
+    to the states last sent when entities change.
+    """
+    entity_ids: list[str] | None = msg.get("entity_ids")
+    if connection.user.permissions.access_all_entities(POLICY_READ):
+        entity_perm = None
+    else:
+        entity_perm = connection.user.permissions.check_entity
+
+    # The state last sent and the latest state of changed entities
+    pending: dict[str, tuple[State | None, State | None]] = {}
+    flush_handle: asyncio.TimerHandle | None = None
+
+    @callback
+    def send_changes() -> None:
+        """Send the changes collected since the last changes were sent."""
+        nonlocal flush_handle
+        flush_handle = None
+        changes = messages.entity_changes(pending)
+        pending.clear()
+        if changes:
+            connection.send_message(messages.event_message(msg["id"], changes))
+
+    @callback
+    def forward_entity_changes(event: Event) -> None:
+        """Collect entity changes to forward to websocket."""
+        nonlocal flush_handle
+        entity_id = event.data["entity_id"]
+        if entity_perm is not None and not entity_perm(entity_id, POLICY_READ):
+            return
+
+        new_state: State | None = event.data["new_state"]
+        if (sent := pending.get(entity_id)) is not None:
+            pending[entity_id] = (sent[0], new_state)
+        else:
+            pending[entity_id] = (event.data["old_state"], new_state)
+
+        if flush_handle is None:
+            flush_handle = hass.loop.call_later(
+                SUBSCRIBE_ENTITIES_COALESCE_DELAY, send_changes
+            )
+
+    if entity_ids is None:
+        unsub_listener = hass.bus.async_listen(
+            EVENT_STATE_CHANGED, forward_entity_changes
+        )
+    else:
+        unsub_listener = async_track_state_change_event(
+            hass, entity_ids, forward_entity_changes
+        )
+
+    @callback
+    def unsubscribe() -> None:
+        """Stop forwarding entity changes."""
+        unsub_listener()
+        if flush_handle is not None:
+            flush_handle.cancel()
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_message(messages.result_message(msg["id"]))
+
+    if entity_ids is None:
+        states = hass.states.async_all()
+    else:
+        states = [
+            state
+            for entity_id in entity_ids
+            if (state := hass.states.get(entity_id)) is not None
+        ]
+    connection.send_message(
+        messages.event_message(
+            msg["id"],
+            {
+                messages.ENTITY_EVENT_ADD: {
+                    state.entity_id: messages.compressed_state_dict(state)
+                    for state in states
+                    if entity_perm is None or entity_perm(state.entity_id, POLICY_READ)
+                }
+            },
+        )
+    )
+
+
 @callback
 @decorators.websocket_command(
     {
@@ -238,7 +340,15 @@ def handle_get_states(
             if entity_perm(state.entity_id, "read")
         ]
 
-    connection.send_message(messages.result_message(msg["id"], states))
+    try:
+        states_json = ",".join(state.as_json() for state in states)
+    except (ValueError, TypeError):
+        connection.send_message(messages.result_message(msg["id"], states))
+        return
+
+    connection.send_message(
+        messages.construct_result_message(msg["id"], f"[{states_json}]")
+    )
 
 
 @decorators.websocket_command({vol.Required("type"): "get_services"})
@@ -314,6 +424,21 @@ def handle_ping(
     connection.send_message(pong_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "supported_features",
+        vol.Required("features"): {str: int},
+    }
+)
+def handle_supported_features(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle setting the features supported by the client."""
+    connection.supported_features = msg["features"]
+    connection.send_result(msg["id"])
+
+
 @decorators.websocket_command(
     {
         vol.Required("type"): "render_template",
@@ -40,6 +40,12 @@ ERR_TEMPLATE_ERROR: Final = "template_error"
 
 TYPE_RESULT: Final = "result"
 
+# Features clients can enable with the supported_features command
+FEATURE_COALESCE_MESSAGES: Final = "coalesce_messages"
+# Limits of the messages coalesced into one frame
+MAX_COALESCED_MESSAGES: Final = 100
+MAX_COALESCED_SIZE: Final = 65536
+
 # Define the possible errors that occur when connections are cancelled.
 # Originally, this was just asyncio.CancelledError, but issue #9546 showed
 # that futures.CancelledErrors can also occur in some situations.
@@ -1,13 +1,12 @@
 """Message templates for websocket commands."""
 from __future__ import annotations
 
-from functools import lru_cache
 import logging
 from typing import Any, Final
 
 import voluptuous as vol
 
-from homeassistant.core import Event
+from homeassistant.core import Event, State
 from homeassistant.helpers import config_validation as cv
 from homeassistant.util.json import (
     find_paths_unserializable_data,
@@ -28,8 +27,20 @@ MINIMAL_MESSAGE_SCHEMA: Final = vol.Schema(
 # Base schema to extend by message handlers
 BASE_COMMAND_MESSAGE_SCHEMA: Final = vol.Schema({vol.Required("id"): cv.positive_int})
 
-IDEN_TEMPLATE: Final = "__IDEN__"
-IDEN_JSON_TEMPLATE: Final = '"__IDEN__"'
+# Keys of compressed states, sent by subscribe_entities
+COMPRESSED_STATE_STATE: Final = "s"
+COMPRESSED_STATE_ATTRIBUTES: Final = "a"
+COMPRESSED_STATE_CONTEXT: Final = "c"
+COMPRESSED_STATE_LAST_CHANGED: Final = "lc"
+COMPRESSED_STATE_LAST_UPDATED: Final = "lu"
+
+# Keys of entity change events, sent by subscribe_entities
+ENTITY_EVENT_ADD: Final = "a"
+ENTITY_EVENT_CHANGE: Final = "c"
+ENTITY_EVENT_REMOVE: Final = "r"
+
+STATE_DIFF_ADDITIONS: Final = "+"
+STATE_DIFF_REMOVALS: Final = "-"
 
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
@@ -61,17 +72,103 @@ def cached_event_message(iden: int, event: Event) -> str:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return _cached_event_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+    try:
+        event_json = event.as_json()
+    except (ValueError, TypeError):
+        return message_to_json(event_message(iden, event))
+    return f'{{"id":{iden},"type":"event","event":{event_json}}}'
 
 
-@lru_cache(maxsize=128)
-def _cached_event_message(event: Event) -> str:
-    """Cache and serialize the event to json.
+def compressed_state_dict(state: State) -> dict[str, Any]:
+    """Return a compressed representation of a state.
 
-    The IDEN_TEMPLATE is used which will be replaced
-    with the actual iden in cached_event_message
+    Timestamps are sent as seconds since the epoch, the last updated time is
+    only sent if it differs from the last changed time.
+    """
+    compressed: dict[str, Any] = {
+        COMPRESSED_STATE_STATE: state.state,
+        COMPRESSED_STATE_ATTRIBUTES: dict(state.attributes),
+        COMPRESSED_STATE_CONTEXT: _compressed_context(state),
+        COMPRESSED_STATE_LAST_CHANGED: state.last_changed.timestamp(),
+    }
+    if state.last_updated != state.last_changed:
+        compressed[COMPRESSED_STATE_LAST_UPDATED] = state.last_updated.timestamp()
+    return compressed
+
+
+def _compressed_context(state: State) -> str | dict[str, Any]:
+    """Return the context of a state, only the id if it has no parent or user."""
+    context = state.context
+    if context.parent_id is None and context.user_id is None:
+        return context.id
+    return context.as_dict()
+
+
+def state_diff(old_state: State, new_state: State) -> dict[str, Any]:
+    """Return the difference between two states of an entity."""
+    additions: dict[str, Any] = {}
+    diff: dict[str, Any] = {STATE_DIFF_ADDITIONS: additions}
+
+    if old_state.state != new_state.state:
+        additions[COMPRESSED_STATE_STATE] = new_state.state
+    if old_state.last_changed != new_state.last_changed:
+        additions[COMPRESSED_STATE_LAST_CHANGED] = new_state.last_changed.timestamp()
+    if old_state.last_updated != new_state.last_updated:
+        additions[COMPRESSED_STATE_LAST_UPDATED] = new_state.last_updated.timestamp()
+    if old_state.context != new_state.context:
+        additions[COMPRESSED_STATE_CONTEXT] = _compressed_context(new_state)
+
+    old_attributes = old_state.attributes
+    new_attributes = new_state.attributes
+    if old_attributes is new_attributes or old_attributes == new_attributes:
+        return diff
+
+    if changed_attributes := {
+        key: value
+        for key, value in new_attributes.items()
+        if key not in old_attributes or old_attributes[key] != value
+    }:
+        additions[COMPRESSED_STATE_ATTRIBUTES] = changed_attributes
+    if removed_attributes := [
+        key for key in old_attributes if key not in new_attributes
+    ]:
+        diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: removed_attributes}
+    return diff
+
+
+def entity_changes(
+    changes: dict[str, tuple[State | None, State | None]]
+) -> dict[str, Any]:
+    """Return the entity change event for changes from one state to another.
+
+    A state of None means the entity did not exist.
     """
-    return message_to_json(event_message(IDEN_TEMPLATE, event))
+    added: dict[str, Any] = {}
+    changed: dict[str, Any] = {}
+    removed: list[str] = []
+
+    for entity_id, (old_state, new_state) in changes.items():
+        if new_state is None:
+            if old_state is not None:
+                removed.append(entity_id)
+        elif old_state is None:
+            added[entity_id] = compressed_state_dict(new_state)
+        elif old_state is not new_state:
+            changed[entity_id] = state_diff(old_state, new_state)
+
+    event: dict[str, Any] = {}
+    if added:
+        event[ENTITY_EVENT_ADD] = added
+    if changed:
+        event[ENTITY_EVENT_CHANGE] = changed
+    if removed:
+        event[ENTITY_EVENT_REMOVE] = removed
+    return event
+
+
+def construct_result_message(iden: int, payload: str) -> str:
+    """Construct a success result message from the JSON of the result."""
+    return f'{{"id":{iden},"type":"result","success":true,"result":{payload}}}'
 
 
 def message_to_json(message: dict[str, Any]) -> str:
@@ -11,6 +11,7 @@ from collections.abc import Awaitable, Collection, Coroutine, Iterable, Mapping
 import datetime
 import enum
 import functools
+import json
 import logging
 import os
 import pathlib
@@ -60,6 +61,7 @@ from homeassistant.exceptions import (
     ServiceNotFound,
     Unauthorized,
 )
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import location
 from homeassistant.util.async_ import (
     fire_coroutine_threadsafe,
@@ -108,6 +110,11 @@ SOURCE_DISCOVERED = "discovered"
 SOURCE_STORAGE = "storage"
 SOURCE_YAML = "yaml"
 
+# Compact JSON serialization shared by the cached State and Event representations
+_json_dumps = functools.partial(
+    json.dumps, cls=JSONEncoder, allow_nan=False, separators=(",", ":")
+)
+
 # How long to wait until things that run on startup have to finish.
 TIMEOUT_EVENT_START = 15
 
@@ -603,7 +610,7 @@ class EventOrigin(enum.Enum):
 class Event:
     """Representation of an event within the bus."""
 
-    __slots__ = ["event_type", "data", "origin", "time_fired", "context"]
+    __slots__ = ["event_type", "data", "origin", "time_fired", "context", "_as_json"]
 
     def __init__(
         self,
@@ -619,6 +626,7 @@ class Event:
         self.origin = origin
         self.time_fired = time_fired or dt_util.utcnow()
         self.context: Context = context or Context()
+        self._as_json: str | None = None
 
     def __hash__(self) -> int:
         """Make hashable."""
@@ -638,6 +646,32 @@ class Event:
             "context": self.context.as_dict(),
         }
 
+    def as_json(self) -> str:
+        """Return a compact JSON representation of this Event.
+
+        Async friendly.
+
+        The JSON is serialized once and shared by all outbound APIs,
+        states in the data reuse their own cached JSON.
+        """
+        if self._as_json is not None:
+            return self._as_json
+        if not any(isinstance(value, State) for value in self.data.values()):
+            self._as_json = _json_dumps(self.as_dict())
+            return self._as_json
+        data = ",".join(
+            f"{_json_dumps(str(key))}:"
+            f"{value.as_json() if isinstance(value, State) else _json_dumps(value)}"
+            for key, value in self.data.items()
+        )
+        self._as_json = (
+            f'{{"event_type":{_json_dumps(self.event_type)},"data":{{{data}}},'
+            f'"origin":{_json_dumps(str(self.origin.value))},'
+            f'"time_fired":"{self.time_fired.isoformat()}",'
+            f'"context":{_json_dumps(self.context.as_dict())}}}'
+        )
+        return self._as_json
+
     def __repr__(self) -> str:
         """Return the representation."""
         if self.data:
@@ -663,6 +697,9 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[tuple[HassJob, Callable | None]]] = {}
+        # event_type -> event data key -> key value -> jobs
+        self._keyed_listeners: dict[str, dict[str, dict[str, list[HassJob]]]] = {}
+        self._keyed_listener_counts: dict[str, int] = {}
         self._hass = hass
 
     @callback
@@ -671,7 +708,23 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(jobs) for key, jobs in self._listeners.items()}
+        for event_type, count in self._keyed_listener_counts.items():
+            listeners[event_type] = listeners.get(event_type, 0) + count
+        return listeners
+
+    @callback
+    def async_keyed_listeners(self, event_type: str, key: str) -> dict[str, int]:
+        """Return dictionary with key values and the number of keyed listeners.
+
+        This method must be run in the event loop.
+        """
+        return {
+            value: len(jobs)
+            for value, jobs in self._keyed_listeners.get(event_type, {})
+            .get(key, {})
+            .items()
+        }
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -708,6 +761,46 @@ class EventBus:
                 event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
             )
 
+        event = Event(event_type, event_data, origin, time_fired, context)
+
+        if event_type != EVENT_TIME_CHANGED:
+            _LOGGER.debug("Bus:Handling %s", event)
+
+        self._async_dispatch(event_type, [event])
+
+    @callback
+    def async_fire_many(
+        self,
+        event_type: str,
+        event_datas: Iterable[dict[str, Any]],
+        origin: EventOrigin = EventOrigin.local,
+        context: Context | None = None,
+        time_fired: datetime.datetime | None = None,
+    ) -> None:
+        """Fire a batch of events of the same type.
+
+        The listeners are looked up once for the whole batch.
+
+        This method must be run in the event loop.
+        """
+        if len(event_type) > MAX_LENGTH_EVENT_EVENT_TYPE:
+            raise MaxLengthExceeded(
+                event_type, "event_type", MAX_LENGTH_EVENT_EVENT_TYPE
+            )
+
+        events = [
+            Event(event_type, event_data, origin, time_fired, context)
+            for event_data in event_datas
+        ]
+        if not events:
+            return
+
+        _LOGGER.debug("Bus:Handling %s %s events", len(events), event_type)
+        self._async_dispatch(event_type, events)
+
+    @callback
+    def _async_dispatch(self, event_type: str, events: list[Event]) -> None:
+        """Dispatch events of the same type to their listeners."""
         listeners = self._listeners.get(event_type, [])
 
         # EVENT_HOMEASSISTANT_CLOSE should go only to his listeners
@@ -715,23 +808,47 @@ class EventBus:
         if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
             listeners = match_all_listeners + listeners
 
-        event = Event(event_type, event_data, origin, time_fired, context)
-
-        if event_type != EVENT_TIME_CHANGED:
-            _LOGGER.debug("Bus:Handling %s", event)
+        for event in events:
+            for job, event_filter in listeners:
+                if event_filter is not None:
+                    try:
+                        if not event_filter(event):
+                            continue
+                    except Exception:  # pylint: disable=broad-except
+                        _LOGGER.exception("Error in event filter")
+                        continue
+                self._hass.async_add_hass_job(job, event)
 
-        if not listeners:
+        if (keyed_listeners := self._keyed_listeners.get(event_type)) is None:
             return
 
-        for job, event_filter in listeners:
-            if event_filter is not None:
+        matches = [
+            (key, value, event)
+            for event in events
+            for key, value_listeners in keyed_listeners.items()
+            if isinstance(value := event.data.get(key), str)
+            and value in value_listeners
+        ]
+        if matches:
+            self._hass.loop.call_soon(
+                self._async_run_keyed_listeners, event_type, matches
+            )
+
+    @callback
+    def _async_run_keyed_listeners(
+        self, event_type: str, matches: list[tuple[str, str, Event]]
+    ) -> None:
+        """Run the listeners keyed by values of an event data key."""
+        keyed_listeners = self._keyed_listeners.get(event_type, {})
+        for key, value, event in matches:
+            if not (jobs := keyed_listeners.get(key, {}).get(value)):
+                continue
+
+            for job in jobs[:]:
                 try:
-                    if not event_filter(event):
-                        continue
+                    self._hass.async_run_hass_job(job, event)
                 except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception("Error in event filter")
-                    continue
-            self._hass.async_add_hass_job(job, event)
+                    _LOGGER.exception("Error while processing %s for %s", event, value)
 
     def listen(self, event_type: str, listener: Callable) -> CALLBACK_TYPE:
         """Listen for all events or events of a specific type.
@@ -785,6 +902,67 @@ class EventBus:
 
         return remove_listener
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        key: str,
+        values: Iterable[str],
+        listener: Callable,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with a value of an event data key.
+
+        The listener is found with a dict lookup on the value of key in the
+        event data, instead of running an event filter for every event.
+
+        This method must be run in the event loop.
+        """
+        # Each value is only registered once, so removal can't fail partway
+        unique_values = set(values)
+        job = HassJob(listener)
+        key_listeners = self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            key, {}
+        )
+        for value in unique_values:
+            key_listeners.setdefault(value, []).append(job)
+        self._keyed_listener_counts[event_type] = (
+            self._keyed_listener_counts.get(event_type, 0) + 1
+        )
+
+        @callback
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_keyed_listener(event_type, key, unique_values, job)
+
+        return remove_listener
+
+    @callback
+    def _async_remove_keyed_listener(
+        self, event_type: str, key: str, values: set[str], job: HassJob
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners = self._keyed_listeners[event_type]
+            key_listeners = keyed_listeners[key]
+            for value in values:
+                key_listeners[value].remove(job)
+                if not key_listeners[value]:
+                    del key_listeners[value]
+        except (KeyError, ValueError):
+            _LOGGER.exception("Unable to remove unknown keyed job listener %s", job)
+            return
+
+        if not key_listeners:
+            del keyed_listeners[key]
+        if not keyed_listeners:
+            del self._keyed_listeners[event_type]
+        self._keyed_listener_counts[event_type] -= 1
+        if not self._keyed_listener_counts[event_type]:
+            del self._keyed_listener_counts[event_type]
+
     def listen_once(
         self, event_type: str, listener: Callable[[Event], None]
     ) -> CALLBACK_TYPE:
@@ -883,6 +1061,7 @@ class State:
         "domain",
         "object_id",
         "_as_dict",
+        "_as_json",
     ]
 
     def __init__(
@@ -912,12 +1091,17 @@ class State:
 
         self.entity_id = entity_id.lower()
         self.state = state
-        self.attributes = MappingProxyType(attributes or {})
+        if isinstance(attributes, MappingProxyType):
+            # Share the read only mapping, e.g. of the previous state
+            self.attributes = attributes
+        else:
+            self.attributes = MappingProxyType(attributes or {})
         self.last_updated = last_updated or dt_util.utcnow()
         self.last_changed = last_changed or self.last_updated
         self.context = context or Context()
         self.domain, self.object_id = split_entity_id(self.entity_id)
         self._as_dict: dict[str, Collection[Any]] | None = None
+        self._as_json: str | None = None
 
     @property
     def name(self) -> str:
@@ -950,6 +1134,17 @@ class State:
             }
         return self._as_dict
 
+    def as_json(self) -> str:
+        """Return a compact JSON representation of the State.
+
+        Async friendly.
+
+        The JSON is serialized once and shared by all outbound APIs.
+        """
+        if self._as_json is None:
+            self._as_json = _json_dumps(self.as_dict())
+        return self._as_json
+
     @classmethod
     def from_dict(cls, json_dict: dict) -> Any:
         """Initialize a state from a dict.
@@ -1196,26 +1391,114 @@ class StateMachine:
         This method must be run in the event loop.
         """
         entity_id = entity_id.lower()
+        now = dt_util.utcnow()
+        old_state = self._states.get(entity_id)
+
+        if (
+            state := self._async_build_state(
+                entity_id, new_state, attributes, force_update, context, now, old_state
+            )
+        ) is None:
+            return
+
+        self._states[entity_id] = state
+        self._bus.async_fire(
+            EVENT_STATE_CHANGED,
+            {"entity_id": entity_id, "old_state": old_state, "new_state": state},
+            EventOrigin.local,
+            state.context,
+            time_fired=now,
+        )
+
+    @callback
+    def async_set_many(
+        self,
+        states: Iterable[tuple[str, str, Mapping[str, Any] | None]],
+        force_update: bool = False,
+        context: Context | None = None,
+    ) -> None:
+        """Set the states of a batch of entities.
+
+        States is an iterable of (entity_id, state, attributes) tuples. All
+        states are validated before any is stored, so an invalid state leaves
+        the state machine unchanged. The state changed events are fired once
+        all states are stored, they share the context and the time they were
+        fired at.
+
+        This method must be run in the event loop.
+        """
+        if context is None:
+            context = Context()
+        now = dt_util.utcnow()
+
+        new_states: dict[str, State] = {}
+        event_datas = []
+        for entity_id, new_state, attributes in states:
+            entity_id = entity_id.lower()
+            if entity_id in new_states:
+                old_state: State | None = new_states[entity_id]
+            else:
+                old_state = self._states.get(entity_id)
+            if (
+                state := self._async_build_state(
+                    entity_id,
+                    new_state,
+                    attributes,
+                    force_update,
+                    context,
+                    now,
+                    old_state,
+                )
+            ) is None:
+                continue
+            new_states[entity_id] = state
+            event_datas.append(
+                {"entity_id": entity_id, "old_state": old_state, "new_state": state}
+            )
+
+        self._states.update(new_states)
+        self._bus.async_fire_many(
+            EVENT_STATE_CHANGED, event_datas, EventOrigin.local, context, now
+        )
+
+    @callback
+    def _async_build_state(
+        self,
+        entity_id: str,
+        new_state: str,
+        attributes: Mapping[str, Any] | None,
+        force_update: bool,
+        context: Context | None,
+        now: datetime.datetime,
+        old_state: State | None,
+    ) -> State | None:
+        """Build the new state of an entity, None if nothing changed.
+
+        Raises if the entity_id or the state is invalid.
+        """
         new_state = str(new_state)
         attributes = attributes or {}
-        if (old_state := self._states.get(entity_id)) is None:
+        if old_state is None:
             same_state = False
             same_attr = False
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == MappingProxyType(attributes)
+            same_attr = old_state.attributes == attributes
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
-            return
+            return None
+
+        if same_attr:
+            # Keep a single attributes mapping alive for both states
+            assert old_state is not None
+            attributes = old_state.attributes
 
         if context is None:
             context = Context()
 
-        now = dt_util.utcnow()
-
-        state = State(
+        return State(
             entity_id,
             new_state,
             attributes,
@@ -1224,14 +1507,6 @@ class StateMachine:
             context,
             old_state is None,
         )
-        self._states[entity_id] = state
-        self._bus.async_fire(
-            EVENT_STATE_CHANGED,
-            {"entity_id": entity_id, "old_state": old_state, "new_state": state},
-            EventOrigin.local,
-            context,
-            time_fired=now,
-        )
 
 
 class Service:
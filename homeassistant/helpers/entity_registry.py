@@ -58,6 +58,9 @@ DISABLED_HASS = "hass"
 DISABLED_INTEGRATION = "integration"
 DISABLED_USER = "user"
 
+# Attributes of the entries which are indexed for reverse lookups
+INDEXED_ATTRIBUTES = ("area_id", "config_entry_id", "device_id", "platform")
+
 STORAGE_VERSION = 1
 STORAGE_KEY = "core.entity_registry"
 
@@ -155,7 +158,13 @@ class EntityRegistry:
         self.hass = hass
         self.entities: dict[str, RegistryEntry]
         self._index: dict[tuple[str, str, str], str] = {}
-        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        # attribute -> attribute value -> entity_id -> entry
+        self._entries_by: dict[str, dict[str, dict[str, RegistryEntry]]] = {
+            attribute: {} for attribute in INDEXED_ATTRIBUTES
+        }
+        self._store = hass.helpers.storage.Store(
+            STORAGE_VERSION, STORAGE_KEY, compact=True
+        )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
         )
@@ -572,19 +581,19 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
-            self.async_remove(entity_id)
+        for entry in self.async_entries_by("config_entry_id", config_entry):
+            self.async_remove(entry.entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self._async_update_entity(entity_id, area_id=None)
+        for entry in self.async_entries_by("area_id", area_id):
+            self._async_update_entity(entry.entity_id, area_id=None)
+
+    @callback
+    def async_entries_by(self, attribute: str, value: str) -> list[RegistryEntry]:
+        """Return the entries with a value of an indexed attribute."""
+        return list(self._entries_by[attribute].get(value, {}).values())
 
     def _register_entry(self, entry: RegistryEntry) -> None:
         self.entities[entry.entity_id] = entry
@@ -592,6 +601,9 @@ class EntityRegistry:
 
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        for attribute, entries_by_value in self._entries_by.items():
+            if (value := getattr(entry, attribute)) is not None:
+                entries_by_value.setdefault(value, {})[entry.entity_id] = entry
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
@@ -599,9 +611,17 @@ class EntityRegistry:
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        for attribute, entries_by_value in self._entries_by.items():
+            if (value := getattr(entry, attribute)) is None:
+                continue
+            entries = entries_by_value[value]
+            del entries[entry.entity_id]
+            if not entries:
+                del entries_by_value[value]
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        self._entries_by = {attribute: {} for attribute in INDEXED_ATTRIBUTES}
         for entry in self.entities.values():
             self._add_index(entry)
 
@@ -635,9 +655,8 @@ def async_entries_for_device(
     """Return entries that match a device."""
     return [
         entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+        for entry in registry.async_entries_by("device_id", device_id)
+        if not entry.disabled_by or include_disabled_entities
     ]
 
 
@@ -646,7 +665,7 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    return registry.async_entries_by("area_id", area_id)
 
 
 @callback
@@ -654,11 +673,15 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    return registry.async_entries_by("config_entry_id", config_entry_id)
+
+
+@callback
+def async_entries_for_platform(
+    registry: EntityRegistry, platform: str
+) -> list[RegistryEntry]:
+    """Return entries that match a platform."""
+    return registry.async_entries_by("platform", platform)
 
 
 @callback
@@ -750,10 +773,7 @@ async def async_migrate_entries(
     """Migrator of unique IDs."""
     ent_reg = await async_get_registry(hass)
 
-    for entry in ent_reg.entities.values():
-        if entry.config_entry_id != config_entry_id:
-            continue
-
+    for entry in async_entries_for_config_entry(ent_reg, config_entry_id):
         updates = entry_callback(entry)
 
         if updates is not None:
@@ -42,9 +42,6 @@ from homeassistant.loader import bind_hass
 from homeassistant.util import dt as dt_util
 from homeassistant.util.async_ import run_callback_threadsafe
 
-TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
-TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
-
 TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
 TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
 
@@ -54,6 +51,8 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+_TEMPLATE_RENDERS = "track_template_renders"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
@@ -238,63 +237,16 @@ def async_track_state_change_event(
     Unlike async_track_state_change, async_track_state_change_event
     passes the full event to the callback.
 
-    In order to avoid having to iterate a long list
-    of EVENT_STATE_CHANGED and fire and create a job
-    for each one, we keep a dict of entity ids that
-    care about the state change events so we can
-    do a fast dict lookup to route events.
+    The listener is subscribed on the event bus keyed by entity_id,
+    so state changes of other entities are routed with a dict lookup
+    instead of an event filter call per listener.
     """
     if not (entity_ids := _async_string_to_lower_list(entity_ids)):
         return _remove_empty_listener
 
-    entity_callbacks = hass.data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
-
-    if TRACK_STATE_CHANGE_LISTENER not in hass.data:
-
-        @callback
-        def _async_state_change_filter(event: Event) -> bool:
-            """Filter state changes by entity_id."""
-            return event.data.get("entity_id") in entity_callbacks
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            entity_id = event.data.get("entity_id")
-
-            if entity_id not in entity_callbacks:
-                return
-
-            for job in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_hass_job(job, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing state change for %s", entity_id
-                    )
-
-        hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED,
-            _async_state_change_dispatcher,
-            event_filter=_async_state_change_filter,
-        )
-
-    job = HassJob(action)
-
-    for entity_id in entity_ids:
-        entity_callbacks.setdefault(entity_id, []).append(job)
-
-    @callback
-    def remove_listener() -> None:
-        """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            hass,
-            TRACK_STATE_CHANGE_CALLBACKS,
-            TRACK_STATE_CHANGE_LISTENER,
-            entity_ids,
-            job,
-        )
-
-    return remove_listener
+    return hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED, ATTR_ENTITY_ID, entity_ids, action
+    )
 
 
 @callback
@@ -784,9 +736,11 @@ class _TrackTemplateResultInfo:
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable] = {}
+        self._strict = False
 
     def async_setup(self, raise_on_template_error: bool, strict: bool = False) -> None:
         """Activation of template tracking."""
+        self._strict = strict
         for track_template_ in self._track_templates:
             template = track_template_.template
             variables = track_template_.variables
@@ -871,6 +825,7 @@ class _TrackTemplateResultInfo:
         track_template_: TrackTemplate,
         now: datetime,
         event: Event | None,
+        replayed: bool | None,
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
@@ -910,9 +865,13 @@ class _TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        if event and not replayed:
+            info = _async_render_for_event(
+                self.hass, event, template, track_template_.variables, self._strict
+            )
+        else:
+            info = template.async_render_to_info(track_template_.variables)
+        self._info[template] = info
 
         try:
             result: str | TemplateError = info.result()
@@ -954,7 +913,9 @@ class _TrackTemplateResultInfo:
         now = event.time_fired if not replayed and event else dt_util.utcnow()
 
         for track_template_ in track_templates or self._track_templates:
-            update = self._render_template_if_ready(track_template_, now, event)
+            update = self._render_template_if_ready(
+                track_template_, now, event, replayed
+            )
             if not update:
                 continue
 
@@ -993,6 +954,34 @@ class _TrackTemplateResultInfo:
         self.hass.async_run_hass_job(self._job, event, updates)
 
 
+@callback
+def _async_render_for_event(
+    hass: HomeAssistant,
+    event: Event,
+    template: Template,
+    variables: TemplateVarsType,
+    strict: bool,
+) -> RenderInfo:
+    """Render a template for a state change event.
+
+    Trackers of the same template and variables share a single render
+    of the template for each event.
+    """
+    rendered_event, renders = hass.data.get(_TEMPLATE_RENDERS, (None, {}))
+    if rendered_event is not event:
+        renders = {}
+        hass.data[_TEMPLATE_RENDERS] = (event, renders)
+
+    template_renders = renders.setdefault((template, strict), [])
+    for rendered_variables, info in template_renders:
+        if rendered_variables == variables:
+            return info
+
+    info = template.async_render_to_info(variables)
+    template_renders.append((variables, info))
+    return info
+
+
 TrackTemplateResultListener = Callable[
     [
         Event,
@@ -1,8 +1,12 @@
 """Helpers to help with encoding Home Assistant objects in JSON."""
+from collections.abc import Generator
 from datetime import datetime, timedelta
 import json
 from typing import Any
 
+# Size in characters the chunks of streamed JSON are buffered up to
+JSON_STREAM_CHUNK_SIZE = 65536
+
 
 class JSONEncoder(json.JSONEncoder):
     """JSONEncoder that supports Home Assistant objects."""
@@ -36,3 +40,40 @@ class ExtendedJSONEncoder(JSONEncoder):
             return super().default(o)
         except TypeError:
             return {"__type": str(type(o)), "repr": repr(o)}
+
+
+def _json_stream_parts(obj: Any) -> Generator[str, None, None]:
+    """Encode an object to JSON, a list item at a time."""
+    if isinstance(obj, (list, tuple)):
+        yield "["
+        for index, item in enumerate(obj):
+            if index:
+                yield ","
+            yield from _json_stream_parts(item)
+        yield "]"
+    elif hasattr(obj, "as_json"):
+        yield obj.as_json()
+    else:
+        yield json.dumps(obj, cls=JSONEncoder, allow_nan=False)
+
+
+def json_stream(
+    obj: Any, chunk_size: int = JSON_STREAM_CHUNK_SIZE
+) -> Generator[str, None, None]:
+    """Encode an object to JSON in chunks of about chunk_size characters.
+
+    Lists are encoded item by item, so the JSON of the whole object is never
+    held in memory at once. Objects with an as_json method, like states, are
+    encoded with it.
+    """
+    parts: list[str] = []
+    size = 0
+    for part in _json_stream_parts(obj):
+        parts.append(part)
+        size += len(part)
+        if size >= chunk_size:
+            yield "".join(parts)
+            parts.clear()
+            size = 0
+    if parts:
+        yield "".join(parts)
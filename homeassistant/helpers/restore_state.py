@@ -27,6 +27,9 @@ STORAGE_VERSION = 1
 # How long between periodically saving the current states to disk
 STATE_DUMP_INTERVAL = timedelta(minutes=15)
 
+# How long periodic dumps are skipped while none of the states changed
+STATE_DUMP_MAX_UNCHANGED = timedelta(days=1)
+
 # How long should a saved state be preserved if the entity no longer exists
 STATE_EXPIRATION = timedelta(days=7)
 
@@ -98,10 +101,12 @@ class RestoreStateData:
         """Initialize the restore state data class."""
         self.hass: HomeAssistant = hass
         self.store: Store = Store(
-            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder
+            hass, STORAGE_VERSION, STORAGE_KEY, encoder=JSONEncoder, compact=True
         )
         self.last_states: dict[str, StoredState] = {}
         self.entity_ids: set[str] = set()
+        self._dumped_states: dict[str, State] = {}
+        self._last_dump: datetime | None = None
 
     @callback
     def async_get_stored_states(self) -> list[StoredState]:
@@ -145,18 +150,47 @@ class RestoreStateData:
 
         return stored_states
 
-    async def async_dump_states(self) -> None:
-        """Save the current state machine to storage."""
+    async def async_dump_states(self, only_changed: bool = False) -> None:
+        """Save the current state machine to storage.
+
+        With only_changed, the dump is skipped if the stored states are the
+        same as in the last dump, unless that dump is getting old. The stored
+        states are converted to dicts in the executor, as that is slow for
+        thousands of states.
+        """
+        stored_states = self.async_get_stored_states()
+        states = {
+            stored_state.state.entity_id: stored_state.state
+            for stored_state in stored_states
+        }
+        now = dt_util.utcnow()
+
+        if (
+            only_changed
+            and self._last_dump is not None
+            and now - self._last_dump < STATE_DUMP_MAX_UNCHANGED
+            and states.keys() == self._dumped_states.keys()
+            and all(
+                state is self._dumped_states[entity_id]
+                for entity_id, state in states.items()
+            )
+        ):
+            _LOGGER.debug("Skipping dump, no states changed")
+            return
+
         _LOGGER.debug("Dumping states")
         try:
             await self.store.async_save(
-                [
-                    stored_state.as_dict()
-                    for stored_state in self.async_get_stored_states()
-                ]
+                await self.hass.async_add_executor_job(
+                    _stored_states_as_dicts, stored_states
+                )
             )
         except HomeAssistantError as exc:
             _LOGGER.error("Error saving current states", exc_info=exc)
+        else:
+            # Only a saved dump allows skipping the next one
+            self._dumped_states = states
+            self._last_dump = now
 
     @callback
     def async_setup_dump(self, *args: Any) -> None:
@@ -165,6 +199,9 @@ class RestoreStateData:
         async def _async_dump_states(*_: Any) -> None:
             await self.async_dump_states()
 
+        async def _async_dump_changed_states(*_: Any) -> None:
+            await self.async_dump_states(only_changed=True)
+
         # Dump the initial states now. This helps minimize the risk of having
         # old states loaded by overwriting the last states once Home Assistant
         # has started and the old states have been read.
@@ -172,7 +209,7 @@ class RestoreStateData:
 
         # Dump states periodically
         cancel_interval = async_track_time_interval(
-            self.hass, _async_dump_states, STATE_DUMP_INTERVAL
+            self.hass, _async_dump_changed_states, STATE_DUMP_INTERVAL
         )
 
         async def _async_dump_states_at_stop(*_: Any) -> None:
@@ -206,6 +243,11 @@ class RestoreStateData:
         self.entity_ids.remove(entity_id)
 
 
+def _stored_states_as_dicts(stored_states: list[StoredState]) -> list[dict[str, Any]]:
+    """Return the dict representations of stored states."""
+    return [stored_state.as_dict() for stored_state in stored_states]
+
+
 def _encode(value: Any) -> Any:
     """Little helper to JSON encode a value."""
     try:
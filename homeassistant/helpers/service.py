@@ -23,7 +23,7 @@ from homeassistant.const import (
     ENTITY_MATCH_ALL,
     ENTITY_MATCH_NONE,
 )
-from homeassistant.core import Context, HomeAssistant, ServiceCall, callback
+from homeassistant.core import Context, Event, HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import (
     HomeAssistantError,
     TemplateError,
@@ -59,6 +59,8 @@ CONF_SERVICE_DATA_TEMPLATE = "data_template"
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
+TARGET_CACHE = "service_target_cache"
+MAX_TARGET_CACHE_SIZE = 256
 
 
 class ServiceParams(TypedDict):
@@ -345,6 +347,74 @@ async def async_extract_referenced_entity_ids(
     dev_reg = device_registry.async_get(hass)
     area_reg = area_registry.async_get(hass)
 
+    cache = _async_get_target_cache(hass, (ent_reg, dev_reg, area_reg))
+    cache_key = (frozenset(selector.device_ids), frozenset(selector.area_ids))
+    if (cached := cache.get(cache_key)) is not None:
+        (
+            indirectly_referenced,
+            referenced_devices,
+            missing_devices,
+            missing_areas,
+        ) = cached
+        selected.indirectly_referenced.update(indirectly_referenced)
+        selected.referenced_devices.update(referenced_devices)
+        selected.missing_devices.update(missing_devices)
+        selected.missing_areas.update(missing_areas)
+        return selected
+
+    _async_resolve_targets(selector, selected, ent_reg, dev_reg, area_reg)
+
+    if len(cache) >= MAX_TARGET_CACHE_SIZE:
+        cache.clear()
+    cache[cache_key] = (
+        frozenset(selected.indirectly_referenced),
+        frozenset(selected.referenced_devices),
+        frozenset(selected.missing_devices),
+        frozenset(selected.missing_areas),
+    )
+    return selected
+
+
+@callback
+def _async_get_target_cache(
+    hass: HomeAssistant, registries: tuple[Any, Any, Any]
+) -> dict[tuple[frozenset[str], frozenset[str]], tuple[frozenset[str], ...]]:
+    """Return the cache of resolved device and area targets.
+
+    The cache is cleared when any of the entity, device or area registries
+    is updated or replaced.
+    """
+    if (target_cache := hass.data.get(TARGET_CACHE)) is None:
+        target_cache = hass.data[TARGET_CACHE] = {"registries": None, "cache": {}}
+
+        @callback
+        def _async_clear_target_cache(_event: Event) -> None:
+            """Clear the cache when a registry is updated."""
+            target_cache["cache"].clear()
+
+        for event_type in (
+            area_registry.EVENT_AREA_REGISTRY_UPDATED,
+            device_registry.EVENT_DEVICE_REGISTRY_UPDATED,
+            entity_registry.EVENT_ENTITY_REGISTRY_UPDATED,
+        ):
+            hass.bus.async_listen(event_type, _async_clear_target_cache)
+
+    if target_cache["registries"] != registries:
+        target_cache["registries"] = registries
+        target_cache["cache"].clear()
+
+    return target_cache["cache"]
+
+
+@callback
+def _async_resolve_targets(
+    selector: ServiceTargetSelector,
+    selected: SelectedEntities,
+    ent_reg: entity_registry.EntityRegistry,
+    dev_reg: device_registry.DeviceRegistry,
+    area_reg: area_registry.AreaRegistry,
+) -> None:
+    """Resolve the device and area targets of a selector to entities."""
     for device_id in selector.device_ids:
         if device_id not in dev_reg.devices:
             selected.missing_devices.add(device_id)
@@ -360,23 +430,24 @@ async def async_extract_referenced_entity_ids(
             selected.referenced_devices.add(device_entry.id)
 
     if not selector.area_ids and not selected.referenced_devices:
-        return selected
+        return
 
-    for ent_entry in ent_reg.entities.values():
-        if (
-            # when area matches the target area
-            ent_entry.area_id in selector.area_ids
-            # when device matches a referenced devices with no explicitly set area
-            or (
-                not ent_entry.area_id
-                and ent_entry.device_id in selected.referenced_devices
-            )
-            # when device matches target device
-            or ent_entry.device_id in selector.device_ids
-        ):
+    # Entities whose area matches the target area
+    for area_id in selector.area_ids:
+        for ent_entry in entity_registry.async_entries_for_area(ent_reg, area_id):
             selected.indirectly_referenced.add(ent_entry.entity_id)
 
-    return selected
+    for device_id in selected.referenced_devices:
+        for ent_entry in entity_registry.async_entries_for_device(
+            ent_reg, device_id, include_disabled_entities=True
+        ):
+            if (
+                # when device matches a referenced device with no explicitly set area
+                not ent_entry.area_id
+                # when device matches target device
+                or device_id in selector.device_ids
+            ):
+                selected.indirectly_referenced.add(ent_entry.entity_id)
 
 
 @bind_hass
@@ -532,9 +603,10 @@ async def entity_service_call(
         user = await hass.auth.async_get_user(call.context.user_id)
         if user is None:
             raise UnknownUser(context=call.context)
-        entity_perms: None | (
-            Callable[[str, str], bool]
-        ) = user.permissions.check_entity
+        entity_perms: None | (Callable[[str, str], bool]) = None
+        # Users who may control all entities need no check per entity
+        if not user.permissions.access_all_entities(POLICY_CONTROL):
+            entity_perms = user.permissions.check_entity
     else:
         entity_perms = None
 
@@ -762,10 +834,7 @@ def verify_domain_control(
 
             authorized = False
 
-            for entity in reg.entities.values():
-                if entity.platform != domain:
-                    continue
-
+            for entity in entity_registry.async_entries_for_platform(reg, domain):
                 if user.permissions.check_entity(entity.entity_id, POLICY_CONTROL):
                     authorized = True
                     break
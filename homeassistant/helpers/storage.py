@@ -78,8 +78,13 @@ class Store:
         private: bool = False,
         *,
         encoder: type[JSONEncoder] | None = None,
+        compact: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        Large stores which are written often should be compact, compact data
+        is serialized several times faster.
+        """
         self.version = version
         self.key = key
         self.hass = hass
@@ -90,6 +95,7 @@ class Store:
         self._write_lock = asyncio.Lock()
         self._load_task: asyncio.Future | None = None
         self._encoder = encoder
+        self._compact = compact
 
     @property
     def path(self):
@@ -240,7 +246,9 @@ class Store:
             os.makedirs(os.path.dirname(path))
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_util.save_json(path, data, self._private, encoder=self._encoder)
+        json_util.save_json(
+            path, data, self._private, encoder=self._encoder, compact=self._compact
+        )
 
     async def _async_migrate_func(self, old_version, old_data):
         """Migrate to the new version."""
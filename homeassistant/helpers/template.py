@@ -4,6 +4,7 @@ from __future__ import annotations
 from ast import literal_eval
 import asyncio
 import base64
+from collections import OrderedDict
 import collections.abc
 from collections.abc import Callable, Generator, Iterable
 from contextlib import contextmanager, suppress
@@ -17,9 +18,9 @@ from operator import attrgetter
 import random
 import re
 import sys
+from types import CodeType
 from typing import Any, cast
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
 from jinja2 import pass_context
@@ -66,6 +67,9 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 
+# Number of compiled templates kept per template environment
+MAX_TEMPLATE_CACHE_SIZE = 4096
+
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -589,9 +593,7 @@ class Template:
         self._strict = strict
         env = self._env
 
-        self._compiled = jinja2.Template.from_code(
-            env, self._compiled_code, env.globals, None
-        )
+        self._compiled = env.template_from_code(self.template, self._compiled_code)
 
         return self._compiled
 
@@ -1674,7 +1676,10 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             undefined = jinja2.StrictUndefined
         super().__init__(undefined=undefined)
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
+        self.template_cache: OrderedDict[str, CodeType] = OrderedDict()
+        self.compiled_templates: OrderedDict[str, jinja2.Template] = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1843,10 +1848,29 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        cached = self.template_cache.get(source)
+        if (cached := self.template_cache.get(source)) is not None:
+            self.cache_hits += 1
+            self.template_cache.move_to_end(source)
+            return cached
 
-        if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+        self.cache_misses += 1
+        cached = self.template_cache[source] = super().compile(source)
+        while len(self.template_cache) > MAX_TEMPLATE_CACHE_SIZE:
+            self.template_cache.popitem(last=False)
+
+        return cached
+
+    def template_from_code(self, source: str, code: CodeType) -> jinja2.Template:
+        """Return the template for compiled code, shared by templates of source."""
+        if (cached := self.compiled_templates.get(source)) is not None:
+            self.compiled_templates.move_to_end(source)
+            return cached
+
+        cached = self.compiled_templates[source] = jinja2.Template.from_code(
+            self, code, self.globals, None
+        )
+        while len(self.compiled_templates) > MAX_TEMPLATE_CACHE_SIZE:
+            self.compiled_templates.popitem(last=False)
 
         return cached
 
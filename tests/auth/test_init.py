@@ -545,6 +545,47 @@ async def test_remove_refresh_token(mock_hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_validate_access_token_cached(mock_hass):
+    """Test verified access tokens are cached until they expire or are removed."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch("homeassistant.auth.jwt.decode") as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+    assert len(mock_decode.mock_calls) == 0
+
+    with patch(
+        "homeassistant.util.dt.utcnow",
+        return_value=dt_util.utcnow() + auth_const.ACCESS_TOKEN_EXPIRATION,
+    ):
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch(
+        "homeassistant.util.dt.utcnow",
+        return_value=dt_util.utcnow()
+        + auth_const.ACCESS_TOKEN_EXPIRATION
+        + timedelta(seconds=11),
+    ), patch(
+        "homeassistant.auth.jwt.decode", side_effect=jwt.ExpiredSignatureError
+    ) as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is None
+    assert len(mock_decode.mock_calls) == 1
+
+    access_token = manager.async_create_access_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    user.is_active = False
+    assert await manager.async_validate_access_token(access_token) is None
+    user.is_active = True
+
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
 async def test_register_revoke_token_callback(mock_hass):
     """Test that a registered revoke token callback is called."""
     manager = await auth.auth_manager_from_config(mock_hass, [], [])
@@ -82,6 +82,91 @@ async def test_if_fires_on_entity_change(hass, calls):
     assert len(calls) == 1
 
 
+async def test_state_trigger_index(hass, calls):
+    """Test state triggers share a listener per entity and count evaluations."""
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: [
+                {
+                    "alias": "first",
+                    "trigger": {
+                        "platform": "state",
+                        "entity_id": ["test.entity", "test.other"],
+                        "to": "world",
+                    },
+                    "action": {"service": "test.automation"},
+                },
+                {
+                    "alias": "second",
+                    "trigger": {"platform": "state", "entity_id": "test.entity"},
+                    "action": {"service": "test.automation"},
+                },
+            ]
+        },
+    )
+    await hass.async_block_till_done()
+    assert hass.bus.async_keyed_listeners("state_changed", "entity_id") == {
+        "test.entity": 1,
+        "test.other": 1,
+    }
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+    hass.states.async_set("test.entity", "planet")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+
+    index = state_trigger.async_get_state_trigger_index(hass)
+    assert sorted(
+        (trigger["automation"], trigger["evaluations"], trigger["matches"])
+        for trigger in (trigger.as_dict() for trigger in index.async_triggers())
+    ) == [("first", 2, 1), ("second", 2, 2)]
+
+    await hass.services.async_call(
+        automation.DOMAIN,
+        SERVICE_TURN_OFF,
+        {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+        blocking=True,
+    )
+    assert index.async_triggers() == []
+    assert hass.bus.async_keyed_listeners("state_changed", "entity_id") == {}
+
+
+async def test_state_trigger_index_failing_listener(hass, caplog):
+    """Test a failing trigger does not stop the other triggers of the entity."""
+    index = state_trigger.async_get_state_trigger_index(hass)
+    values = []
+
+    def failing_listener(event, from_value, to_value):
+        raise ValueError("Failing listener")
+
+    def listener(event, from_value, to_value):
+        values.append((from_value, to_value))
+
+    unsubs = [
+        index.async_add(
+            state_trigger.StateTrigger(
+                "failing", None, ["test.entity"], None, failing_listener
+            )
+        ),
+        index.async_add(
+            state_trigger.StateTrigger("working", None, ["test.entity"], None, listener)
+        ),
+    ]
+
+    hass.states.async_set("test.entity", "world")
+    await hass.async_block_till_done()
+
+    assert values == [("hello", "world")]
+    assert "Error evaluating state trigger of failing" in caplog.text
+    assert "Failing listener" in caplog.text
+
+    for unsub in unsubs:
+        unsub()
+
+
 async def test_if_fires_on_entity_change_with_from_filter(hass, calls):
     """Test for firing on entity change with filter."""
     assert await async_setup_component(
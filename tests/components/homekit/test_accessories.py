@@ -37,13 +37,13 @@ from homeassistant.const import (
     ATTR_MODEL,
     ATTR_SERVICE,
     ATTR_SW_VERSION,
+    EVENT_STATE_CHANGED,
     STATE_OFF,
     STATE_ON,
     STATE_UNAVAILABLE,
     __version__,
     __version__ as hass_version,
 )
-from homeassistant.helpers.event import TRACK_STATE_CHANGE_CALLBACKS
 
 from tests.common import async_mock_service
 
@@ -59,9 +59,11 @@ async def test_accessory_cancels_track_state_change_on_stop(hass, hk_driver):
         "homeassistant.components.homekit.accessories.HomeAccessory.async_update_state"
     ):
         await acc.run()
-    assert len(hass.data[TRACK_STATE_CHANGE_CALLBACKS][entity_id]) == 1
+    listeners = hass.bus.async_keyed_listeners(EVENT_STATE_CHANGED, ATTR_ENTITY_ID)
+    assert listeners[entity_id] == 1
     await acc.stop()
-    assert entity_id not in hass.data[TRACK_STATE_CHANGE_CALLBACKS]
+    listeners = hass.bus.async_keyed_listeners(EVENT_STATE_CHANGED, ATTR_ENTITY_ID)
+    assert entity_id not in listeners
 
 
 async def test_home_accessory(hass, hk_driver):
@@ -68,6 +68,36 @@ async def test_access_from_banned_ip(hass, aiohttp_client):
         assert resp.status == HTTP_FORBIDDEN
 
 
+async def test_access_from_banned_network(hass, aiohttp_client):
+    """Test accessing to server from an IP in a banned network."""
+    app = web.Application()
+    app["hass"] = hass
+    setup_bans(hass, app, 5)
+    set_real_ip = mock_real_ip(app)
+
+    with patch(
+        "homeassistant.components.http.ban.async_load_ip_bans_config",
+        return_value=[IpBan("200.201.202.0/24"), IpBan("2001:db8::/32")],
+    ):
+        client = await aiohttp_client(app)
+
+    for remote_addr, status in (
+        ("200.201.202.203", HTTP_FORBIDDEN),
+        ("200.201.203.1", 404),
+        ("2001:db8::1", HTTP_FORBIDDEN),
+        ("2001:db9::1", 404),
+    ):
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == status
+
+    assert [str(ip_ban) for ip_ban in app[KEY_BANNED_IPS]] == [
+        "200.201.202.0/24",
+        "2001:db8::/32",
+    ]
+    assert str(IpBan("200.201.202.203")) == "200.201.202.203"
+
+
 @pytest.mark.parametrize(
     "remote_addr, bans, status",
     list(
@@ -0,0 +1,62 @@
+"""The tests for the recorder state accumulators."""
+# pylint: disable=protected-access
+from datetime import timedelta
+
+from homeassistant.components.recorder.accumulators import StateAccumulators
+from homeassistant.core import State
+import homeassistant.util.dt as dt_util
+
+
+def test_state_accumulators_prune_periods():
+    """Test only the previous and the current period are kept."""
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    accumulators = StateAccumulators(start)
+
+    for minutes in range(0, 60):
+        accumulators.add_state(
+            "sensor.test",
+            State(
+                "sensor.test",
+                str(minutes),
+                last_updated=start + timedelta(minutes=minutes, seconds=1),
+            ),
+            start + timedelta(minutes=minutes, seconds=1),
+        )
+
+    assert len(accumulators._periods) == 2
+    assert not accumulators.covers(start)
+    assert not accumulators.covers(start + timedelta(minutes=45))
+    assert accumulators.covers(start + timedelta(minutes=50))
+
+    summary = accumulators.summarize_period(
+        start + timedelta(minutes=50), ["sensor.test"]
+    )["sensor.test"]
+    assert (summary.min, summary.max) == (49.0, 54.0)
+
+
+def test_state_accumulators_unavailable_period():
+    """Test a value is not carried into periods after a non-numeric state."""
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    accumulators = StateAccumulators(start)
+
+    for minutes, state in ((1, "10"), (2, "20"), (3, "unavailable")):
+        time = start + timedelta(minutes=minutes)
+        accumulators.add_state(
+            "sensor.test", State("sensor.test", state, last_updated=time), time
+        )
+    time = start + timedelta(minutes=6)
+    accumulators.add_state(
+        "sensor.other", State("sensor.other", "5", last_updated=time), time
+    )
+
+    # The value before the unavailable state is valid until the period ends
+    summary = accumulators.summarize_period(start, ["sensor.test"])["sensor.test"]
+    assert (summary.min, summary.max, summary.last_value) == (10.0, 20.0, 20.0)
+    assert summary.time_weighted_mean(start + timedelta(minutes=5)) == 17.5
+    assert summary.stopped
+
+    # The sensor is unavailable during the full next periods
+    for minutes in (5, 10):
+        assert not accumulators.summarize_period(
+            start + timedelta(minutes=minutes), ["sensor.test"]
+        )
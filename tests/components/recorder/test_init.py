@@ -2,18 +2,22 @@
 # pylint: disable=protected-access
 from datetime import datetime, timedelta
 import sqlite3
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
+from sqlalchemy import event as sqlalchemy_event
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
+    CONF_DB_MAX_READERS,
     CONF_DB_URL,
     CONFIG_SCHEMA,
+    DEFAULT_COMMIT_INTERVAL,
     DOMAIN,
     KEEPALIVE_TIME,
+    CommitTask,
     SERVICE_DISABLE,
     SERVICE_ENABLE,
     SERVICE_PURGE,
@@ -28,6 +32,7 @@ from homeassistant.components.recorder.const import DATA_INSTANCE
 from homeassistant.components.recorder.models import (
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     StatisticsRuns,
     process_timestamp,
@@ -147,30 +152,111 @@ async def test_saving_state(
     assert state == _state_empty_context(hass, entity_id)
 
 
+async def test_saving_states_with_shared_attributes(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test identical attributes are stored once and shared between states."""
+    instance = await async_setup_recorder_instance(hass)
+
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+
+    hass.states.async_set("test.recorder", "on", attributes)
+    hass.states.async_set("test.recorder_2", "on", attributes)
+    await async_wait_recording_done(hass, instance)
+    # The attributes id is now cached, so the next state reuses it
+    hass.states.async_set("test.recorder", "off", attributes)
+    await async_wait_recording_done(hass, instance)
+
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 3
+        assert len({db_state.attributes_id for db_state in db_states}) == 1
+        assert db_states[0].attributes is None
+        assert db_states[0].to_native().attributes == attributes
+        assert session.query(StateAttributes).count() == 1
+
+
 async def test_saving_many_states(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
-    """Test we expire after many commits."""
+    """Test states written in one commit are linked to their old states."""
     instance = await async_setup_recorder_instance(hass)
 
     entity_id = "test.recorder"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    with patch.object(
-        hass.data[DATA_INSTANCE].event_session, "expire_all"
-    ) as expire_all, patch.object(recorder, "EXPIRE_AFTER_COMMITS", 2):
-        for _ in range(3):
-            hass.states.async_set(entity_id, "on", attributes)
-            await async_wait_recording_done(hass, instance)
-            hass.states.async_set(entity_id, "off", attributes)
-            await async_wait_recording_done(hass, instance)
+    hass.states.async_set(entity_id, "on", attributes)
+    hass.states.async_set("test.other", "on", attributes)
+    await async_wait_recording_done(hass, instance)
 
-    assert expire_all.called
+    state_inserts = []
+
+    def _count_state_inserts(conn, cursor, statement, parameters, context, many):
+        if statement.startswith("INSERT INTO states "):
+            state_inserts.append(len(parameters) if many else 1)
+
+    sqlalchemy_event.listen(
+        instance.engine, "before_cursor_execute", _count_state_inserts
+    )
+    for count in range(3):
+        hass.states.async_set(entity_id, "off", attributes)
+        hass.states.async_set("test.other", str(count), attributes)
+        hass.states.async_set(entity_id, "on", attributes)
+    await async_wait_recording_done(hass, instance)
+    sqlalchemy_event.remove(
+        instance.engine, "before_cursor_execute", _count_state_inserts
+    )
+
+    # One executemany per generation, every entity once per generation
+    assert state_inserts == [2, 2, 2, 1, 1, 1]
 
     with session_scope(hass=hass) as session:
-        db_states = list(session.query(States))
-        assert len(db_states) == 6
+        db_states = list(
+            session.query(States)
+            .filter(States.entity_id == entity_id)
+            .order_by(States.last_updated)
+        )
+        assert len(db_states) == 7
         assert db_states[0].event_id > 0
+        assert db_states[0].old_state_id is None
+        for old_state, new_state in zip(db_states, db_states[1:]):
+            assert new_state.old_state_id == old_state.state_id
+        other_states = session.query(States).filter(States.entity_id == "test.other")
+        assert other_states.count() == 4
+
+
+async def test_saving_many_states_returning_ids(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test states are linked by returned ids on databases with many writers."""
+    instance = await async_setup_recorder_instance(hass)
+
+    entity_id = "test.recorder"
+    readbacks = []
+
+    def _count_readbacks(conn, cursor, statement, parameters, context, many):
+        if "DESC" in statement and "LIMIT" in statement:
+            readbacks.append(statement)
+
+    sqlalchemy_event.listen(instance.engine, "before_cursor_execute", _count_readbacks)
+    with patch.object(instance.engine.dialect, "name", "postgresql"):
+        for state in ("on", "off", "on"):
+            hass.states.async_set(entity_id, state)
+        await async_wait_recording_done(hass, instance)
+    sqlalchemy_event.remove(instance.engine, "before_cursor_execute", _count_readbacks)
+
+    assert not readbacks
+
+    with session_scope(hass=hass) as session:
+        db_states = list(
+            session.query(States)
+            .filter(States.entity_id == entity_id)
+            .order_by(States.last_updated)
+        )
+        assert len(db_states) == 3
+        assert db_states[0].old_state_id is None
+        for old_state, new_state in zip(db_states, db_states[1:]):
+            assert new_state.old_state_id == old_state.state_id
 
 
 async def test_saving_state_with_intermixed_time_changes(
@@ -199,6 +285,26 @@ async def test_saving_state_with_intermixed_time_changes(
         assert db_states[0].event_id > 0
 
 
+async def test_commit_interval_without_time_changed_events(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test commits are queued on an interval and time changes are not queued."""
+    instance = await async_setup_recorder_instance(hass)
+    hass.states.async_set("test.recorder", "on")
+    await hass.async_block_till_done()
+
+    with patch.object(instance, "queue", MagicMock(wraps=instance.queue)) as queue_mock:
+        async_fire_time_changed(
+            hass, dt_util.utcnow() + timedelta(seconds=DEFAULT_COMMIT_INTERVAL)
+        )
+        await hass.async_block_till_done()
+    assert [type(call[0][0]) for call in queue_mock.put.call_args_list] == [CommitTask]
+
+    await async_wait_recording_done(hass, instance)
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 1
+
+
 def test_saving_state_with_exception(hass, hass_recorder, caplog):
     """Test saving and restoring a state."""
     hass = hass_recorder()
@@ -207,17 +313,18 @@ def test_saving_state_with_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in hass.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    event_session = hass.data[DATA_INSTANCE].event_session
+    bulk_save_objects = event_session.bulk_save_objects
+
+    def _throw_if_state_in_objects(objects, **kwargs):
+        if any(isinstance(obj, States) for obj in objects):
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        return bulk_save_objects(objects, **kwargs)
 
     with patch("time.sleep"), patch.object(
-        hass.data[DATA_INSTANCE].event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        event_session,
+        "bulk_save_objects",
+        side_effect=_throw_if_state_in_objects,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -245,17 +352,18 @@ def test_saving_state_with_sqlalchemy_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in hass.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise SQLAlchemyError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    event_session = hass.data[DATA_INSTANCE].event_session
+    bulk_save_objects = event_session.bulk_save_objects
+
+    def _throw_if_state_in_objects(objects, **kwargs):
+        if any(isinstance(obj, States) for obj in objects):
+            raise SQLAlchemyError("insert the state", "fake params", "forced to fail")
+        return bulk_save_objects(objects, **kwargs)
 
     with patch("time.sleep"), patch.object(
-        hass.data[DATA_INSTANCE].event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        event_session,
+        "bulk_save_objects",
+        side_effect=_throw_if_state_in_objects,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -1035,6 +1143,33 @@ def test_service_disable_run_information_recorded(tmpdir):
     hass.stop()
 
 
+def test_read_only_sessions_use_separate_pool(tmpdir):
+    """Test read only sessions use their own read only pool."""
+    test_db_file = tmpdir.mkdir("sqlite").join("test_read_only.db")
+    dburl = f"{SQLITE_URL_PREFIX}//{test_db_file}"
+
+    hass = get_test_home_assistant()
+    setup_component(
+        hass, DOMAIN, {DOMAIN: {CONF_DB_URL: dburl, CONF_DB_MAX_READERS: 2}}
+    )
+    hass.start()
+    hass.states.set("test.recorder", "on")
+    wait_recording_done(hass)
+
+    instance = hass.data[DATA_INSTANCE]
+    assert instance.read_engine is not None
+    assert instance.read_engine.pool.size() == 2
+
+    with session_scope(hass=hass, read_only=True) as session:
+        assert session.bind is instance.read_engine
+        assert session.query(States).count() == 1
+        with pytest.raises(OperationalError):
+            session.query(States).delete()
+
+    hass.stop()
+    assert instance.read_engine is None
+
+
 class CannotSerializeMe:
     """A class that the JSONEncoder cannot serialize."""
 
@@ -2,13 +2,14 @@
 from datetime import datetime
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import scoped_session, sessionmaker
 
 from homeassistant.components.recorder.models import (
     Base,
     Events,
     RecorderRuns,
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -40,6 +41,20 @@ def test_from_event_to_db_state():
     assert state == States.from_event(event).to_native()
 
 
+def test_from_event_to_db_state_attributes():
+    """Test converting event to db state attributes."""
+    attrs = {"this_attr": True}
+    state = ha.State("sensor.temperature", "18", attrs)
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "sensor.temperature", "old_state": None, "new_state": state},
+        context=state.context,
+    )
+    db_attrs = StateAttributes.from_event(event)
+    assert db_attrs.to_native() == attrs
+    assert db_attrs.hash == StateAttributes.hash_shared_attrs('{"this_attr":true}')
+
+
 def test_from_event_to_delete_state():
     """Test converting deleting state event to db state."""
     event = ha.Event(
@@ -127,6 +142,41 @@ def test_entity_ids():
     assert run.entity_ids(in_run2) == ["sensor.humidity"]
 
 
+def test_timestamps_stored_as_floats():
+    """Test timestamps are stored as epoch floats and read back as UTC datetimes."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    session = scoped_session(sessionmaker(bind=engine))
+
+    est = dt_util.get_time_zone("US/Eastern")
+    session.add(
+        States(
+            entity_id="sensor.temperature",
+            state="20",
+            last_changed=datetime(2016, 7, 9, 11, 0, 0, 123456, tzinfo=est),
+            last_updated=datetime(2016, 7, 9, 15, 0, 0, 123456),
+        )
+    )
+    session.commit()
+
+    raw = session.execute(
+        text("SELECT last_changed_ts, last_updated_ts FROM states")
+    ).first()
+    assert raw == (1468076400.123456, 1468076400.123456)
+
+    db_state = session.query(States).first()
+    expected = datetime(2016, 7, 9, 15, 0, 0, 123456, tzinfo=dt.UTC)
+    assert db_state.last_changed == expected
+    assert db_state.last_changed.tzinfo == dt.UTC
+    assert db_state.last_updated == expected
+    assert (
+        session.query(States)
+        .filter(States.last_updated > datetime(2016, 7, 9, 14, 0, 0, tzinfo=dt.UTC))
+        .count()
+        == 1
+    )
+
+
 def test_states_from_native_invalid_entity_id():
     """Test loading a state from an invalid entity ID."""
     state = States()
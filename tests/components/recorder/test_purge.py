@@ -10,7 +10,12 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components import recorder
 from homeassistant.components.recorder import PurgeTask
 from homeassistant.components.recorder.const import MAX_ROWS_TO_PURGE
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -85,6 +90,94 @@ async def test_purge_old_states(
         assert "test.recorder2" in instance._old_states
 
 
+async def test_purge_old_states_in_id_chunks(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test old states are purged one event id chunk per pass."""
+    instance = await async_setup_recorder_instance(hass)
+
+    await _add_test_states(hass, instance)
+
+    with session_scope(hass=hass) as session, patch(
+        "homeassistant.components.recorder.purge.MAX_IDS_PER_PURGE_CHUNK", 2
+    ):
+        states = session.query(States)
+        assert states.count() == 6
+
+        purge_before = dt_util.utcnow() - timedelta(days=4)
+
+        assert not purge_old_data(instance, purge_before, repack=False)
+        assert states.count() == 4
+        assert not purge_old_data(instance, purge_before, repack=False)
+        assert states.count() == 2
+        assert purge_old_data(instance, purge_before, repack=False)
+        assert states.count() == 2
+
+        states_after_purge = session.query(States)
+        assert states_after_purge[1].old_state_id == states_after_purge[0].state_id
+        assert states_after_purge[0].old_state_id is None
+        assert session.query(StateAttributes).count() == 1
+        assert "test.recorder2" in instance._old_states
+
+
+async def test_purge_old_states_keeps_links_of_kept_states(
+    hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test kept states keep old_state_id when the purged states interleave."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+
+    with recorder.session_scope(hass=hass) as session:
+        old_state_id = None
+        state_ids = {}
+        for entity_id, timestamp in (
+            ("test.purged", eleven_days_ago),
+            ("test.kept", utcnow),
+            ("test.purged", eleven_days_ago),
+            ("test.kept", utcnow),
+            ("test.purged", utcnow),
+        ):
+            event = Events(
+                event_type=EVENT_STATE_CHANGED,
+                event_data="{}",
+                origin="LOCAL",
+                time_fired=timestamp,
+            )
+            session.add(event)
+            session.flush()
+            state = States(
+                entity_id=entity_id,
+                state="on",
+                attributes="{}",
+                last_changed=timestamp,
+                last_updated=timestamp,
+                event_id=event.event_id,
+                old_state_id=state_ids.get(entity_id),
+            )
+            session.add(state)
+            session.flush()
+            state_ids[entity_id] = state.state_id
+            if entity_id == "test.kept" and old_state_id is None:
+                old_state_id = state.state_id
+
+    with recorder.session_scope(hass=hass) as session:
+        purge_before = utcnow - timedelta(days=4)
+        assert not purge_old_data(instance, purge_before, repack=False)
+        assert purge_old_data(instance, purge_before, repack=False)
+
+        states = session.query(States).order_by(States.state_id).all()
+        assert [state.entity_id for state in states] == [
+            "test.kept",
+            "test.kept",
+            "test.purged",
+        ]
+        assert states[1].old_state_id == old_state_id == states[0].state_id
+        assert states[2].old_state_id is None
+
+
 async def test_purge_old_states_encouters_database_corruption(
     hass: HomeAssistant, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
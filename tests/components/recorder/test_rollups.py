@@ -0,0 +1,232 @@
+"""The tests for the downsampled history of numeric states."""
+# pylint: disable=protected-access,invalid-name
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+
+from homeassistant.components.recorder import history, rollups as rollups_module
+from homeassistant.components.recorder.const import DATA_INSTANCE
+from homeassistant.components.recorder.models import (
+    StateRollupsHourly,
+    StateRollupsShortTerm,
+    StatisticsRuns,
+    StatisticsShortTerm,
+)
+from homeassistant.components.recorder.rollups import rollup_tier_for_period
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.setup import setup_component
+import homeassistant.util.dt as dt_util
+
+from tests.components.recorder.common import wait_recording_done
+
+
+def test_rollup_tier_for_period():
+    """Test the rollup tier is picked from the period and the point budget."""
+    start = dt_util.utcnow()
+    assert rollup_tier_for_period(start, start + timedelta(hours=1), 500) is None
+    assert (
+        rollup_tier_for_period(start, start + timedelta(days=1), 500)
+        is StateRollupsShortTerm
+    )
+    assert (
+        rollup_tier_for_period(start, start + timedelta(days=7), 500)
+        is StateRollupsHourly
+    )
+    assert rollup_tier_for_period(
+        start, start + timedelta(days=3650), 500
+    ).duration == timedelta(days=1)
+
+
+def test_compile_rollups(hass_recorder):
+    """Test compiling rollups and serving downsampled history from them."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=2
+    )
+    start = hour + timedelta(minutes=55)
+
+    def set_state(entity_id, state, timestamp):
+        """Set the state."""
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow", return_value=timestamp
+        ):
+            hass.states.set(entity_id, state)
+            wait_recording_done(hass)
+
+    set_state("sensor.test", "5", hour - timedelta(minutes=1))
+    set_state("switch.test", "off", hour - timedelta(minutes=1))
+    for minute, state in ((1, "10"), (2, "20"), (3, "unavailable"), (4, "30")):
+        set_state("sensor.test", state, start + timedelta(minutes=minute))
+    set_state("switch.test", "on", start + timedelta(minutes=1))
+
+    recorder.do_adhoc_statistics(start=start)
+    wait_recording_done(hass)
+
+    expected = {"mean": 20.0, "min": 10.0, "max": 30.0, "last": 30.0}
+    with session_scope(hass=hass) as session:
+        for tier, tier_start in (
+            (StateRollupsShortTerm, start),
+            (StateRollupsHourly, hour),
+        ):
+            rollups = session.query(tier).all()
+            assert len(rollups) == 1
+            assert rollups[0].entity_id == "sensor.test"
+            assert rollups[0].start == tier_start
+            assert {key: getattr(rollups[0], key) for key in expected} == expected
+
+        result = history.get_downsampled_states_with_session(
+            hass,
+            session,
+            hour,
+            hour + timedelta(hours=2),
+            ["switch.test", "sensor.test"],
+            10,
+        )
+
+    assert list(result) == ["switch.test", "sensor.test"]
+    assert [state.state for state in result["switch.test"]] == ["off", "on"]
+    assert result["sensor.test"][0].state == "5"
+    assert result["sensor.test"][1:] == [
+        {
+            "state": "20.0",
+            "last_changed": hour.isoformat(),
+            "min": 10.0,
+            "max": 30.0,
+        }
+    ]
+
+
+def test_compile_rollups_time_weighted(hass_recorder):
+    """Test rollups are weighted by time and carry stable values forward."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    hour = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=2
+    )
+
+    def set_state(entity_id, state, timestamp):
+        """Set the state."""
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow", return_value=timestamp
+        ):
+            hass.states.set(entity_id, state)
+            wait_recording_done(hass)
+
+    set_state("sensor.test", "20", hour + timedelta(minutes=1))
+    set_state("sensor.test", "100", hour + timedelta(minutes=9, seconds=59))
+    set_state("sensor.test", "20", hour + timedelta(minutes=10))
+
+    for minutes in range(0, 60, 5):
+        recorder.do_adhoc_statistics(start=hour + timedelta(minutes=minutes))
+        wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        rollups = (
+            session.query(StateRollupsShortTerm)
+            .order_by(StateRollupsShortTerm.start)
+            .all()
+        )
+        assert [rollup.start for rollup in rollups] == [
+            hour + timedelta(minutes=minutes) for minutes in range(0, 60, 5)
+        ]
+        assert [
+            (rollup.mean, rollup.min, rollup.max, rollup.last, rollup.seconds)
+            for rollup in rollups[:4]
+        ] == [
+            (20.0, 20.0, 20.0, 20.0, 240.0),
+            (pytest.approx((20 * 299 + 100) / 300), 20.0, 100.0, 100.0, 300.0),
+            (20.0, 20.0, 20.0, 20.0, 300.0),
+            (20.0, 20.0, 20.0, 20.0, 300.0),
+        ]
+
+        hourly = session.query(StateRollupsHourly).one()
+        assert hourly.start == hour
+        assert hourly.seconds == 3540.0
+        assert hourly.mean == pytest.approx((20 * 3539 + 100) / 3540)
+        assert hourly.max == 100.0
+
+
+def test_compile_rollups_removed_entity(hass_recorder):
+    """Test statistics and rollups are compiled when an entity was removed."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0) - timedelta(
+        hours=1
+    )
+    attributes = {"state_class": "measurement", "unit_of_measurement": "%"}
+
+    for minutes, entity_id in ((1, "sensor.test"), (1, "sensor.removed"), (2, None)):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow",
+            return_value=start + timedelta(minutes=minutes),
+        ):
+            if entity_id:
+                hass.states.set(entity_id, "10", attributes)
+            else:
+                hass.states.remove("sensor.removed")
+            wait_recording_done(hass)
+
+    recorder.do_adhoc_statistics(start=start)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StatisticsRuns).filter_by(start=start).count() == 1
+        assert session.query(StatisticsShortTerm).count() == 1
+        rollups = (
+            session.query(StateRollupsShortTerm)
+            .order_by(StateRollupsShortTerm.entity_id)
+            .all()
+        )
+        assert [(rollup.entity_id, rollup.mean) for rollup in rollups] == [
+            ("sensor.removed", 10.0),
+            ("sensor.test", 10.0),
+        ]
+
+
+def test_compile_rollups_accumulated(hass_recorder):
+    """Test rollups are compiled from the states summarized by the recorder."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    now = dt_util.utcnow()
+    zero = now.replace(minute=now.minute - now.minute % 5, second=0, microsecond=0)
+    zero += timedelta(minutes=5)
+
+    hass.states.set("sensor.stable", "30")
+    wait_recording_done(hass)
+    for minutes, state in ((1, "10"), (2, "unavailable")):
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow",
+            return_value=zero + timedelta(minutes=minutes),
+        ):
+            hass.states.set("sensor.test", state)
+            wait_recording_done(hass)
+
+    with patch.object(rollups_module, "_summarize_history") as summarize_mock:
+        recorder.do_adhoc_statistics(start=zero)
+        wait_recording_done(hass)
+    summarize_mock.assert_not_called()
+
+    with session_scope(hass=hass) as session:
+        rollups = (
+            session.query(StateRollupsShortTerm)
+            .order_by(StateRollupsShortTerm.entity_id)
+            .all()
+        )
+        assert [
+            (
+                rollup.entity_id,
+                rollup.start,
+                rollup.mean,
+                rollup.min,
+                rollup.max,
+                rollup.last,
+                rollup.seconds,
+            )
+            for rollup in rollups
+        ] == [
+            ("sensor.stable", zero, 30.0, 30.0, 30.0, 30.0, 300.0),
+            ("sensor.test", zero, 10.0, 10.0, 10.0, None, 240.0),
+        ]
@@ -161,6 +161,23 @@ def test_setup_connection_for_dialect_mysql(mysql_version, db_supports_row_numbe
     assert instance_mock._db_supports_row_number == db_supports_row_number
 
 
+def test_setup_read_only_connection_for_dialect_postgresql():
+    """Test setting up a read only connection for a postgresql dialect."""
+    execute_args = []
+
+    def execute_mock(statement):
+        execute_args.append(statement)
+
+    dbapi_connection = MagicMock(
+        cursor=lambda: MagicMock(execute=execute_mock, close=MagicMock())
+    )
+
+    util.setup_read_only_connection_for_dialect("postgresql", dbapi_connection)
+
+    assert execute_args == ["SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY"]
+    assert dbapi_connection.commit.called
+
+
 @pytest.mark.parametrize(
     "sqlite_version, db_supports_row_number",
     [
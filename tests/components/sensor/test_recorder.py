@@ -133,6 +133,83 @@ def test_compile_hourly_statistics(
     assert "Error while processing event StatisticsTask" not in caplog.text
 
 
+@pytest.mark.parametrize(
+    "device_class,unit,native_unit,mean,min,max",
+    [
+        (None, "%", "%", 13.050847, -10, 30),
+        ("pressure", "hPa", "Pa", 1305.0847, -1000, 3000),
+        ("temperature", "°F", "°C", -10.52731, -23.33333, -1.111111),
+    ],
+)
+def test_compile_hourly_statistics_accumulated(
+    hass_recorder, device_class, unit, native_unit, mean, min, max
+):
+    """Test compiling statistics from the states summarized by the recorder."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    now = dt_util.utcnow()
+    zero = now.replace(minute=now.minute - now.minute % 5, second=0, microsecond=0)
+    zero += timedelta(minutes=5)
+    attributes = {
+        "device_class": device_class,
+        "state_class": "measurement",
+        "unit_of_measurement": unit,
+    }
+    record_states(hass, zero, "sensor.test1", attributes)
+
+    with patch.object(
+        history, "get_significant_states_with_session"
+    ) as significant_states_mock:
+        recorder.do_adhoc_statistics(start=zero)
+        wait_recording_done(hass)
+    significant_states_mock.assert_not_called()
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats == {
+        "sensor.test1": [
+            {
+                "statistic_id": "sensor.test1",
+                "start": process_timestamp_to_utc_isoformat(zero),
+                "end": process_timestamp_to_utc_isoformat(zero + timedelta(minutes=5)),
+                "mean": approx(mean),
+                "min": approx(min),
+                "max": approx(max),
+                "last_reset": None,
+                "state": None,
+                "sum": None,
+            }
+        ]
+    }
+
+
+def test_compile_hourly_statistics_accumulated_wanted(hass_recorder):
+    """Test only the wanted statistics are compiled from the summarized states."""
+    hass = hass_recorder()
+    recorder = hass.data[DATA_INSTANCE]
+    setup_component(hass, "sensor", {})
+    now = dt_util.utcnow()
+    zero = now.replace(minute=now.minute - now.minute % 5, second=0, microsecond=0)
+    zero += timedelta(minutes=5)
+    attributes = {"state_class": "measurement", "unit_of_measurement": "%"}
+    record_states(hass, zero, "sensor.test1", attributes)
+
+    with patch.dict(
+        "homeassistant.components.sensor.recorder.DEFAULT_STATISTICS",
+        {"measurement": {"mean"}},
+    ), patch.object(
+        history, "get_significant_states_with_session"
+    ) as significant_states_mock:
+        recorder.do_adhoc_statistics(start=zero)
+        wait_recording_done(hass)
+    significant_states_mock.assert_not_called()
+
+    stats = statistics_during_period(hass, zero, period="5minute")
+    assert stats["sensor.test1"][0]["mean"] == approx(13.050847)
+    assert stats["sensor.test1"][0]["min"] is None
+    assert stats["sensor.test1"][0]["max"] is None
+
+
 @pytest.mark.parametrize(
     "device_class,unit,native_unit",
     [
@@ -602,6 +602,130 @@ async def test_subscribe_unsubscribe_events_state_changed(
     assert msg["event"]["data"]["entity_id"] == "light.permitted"
 
 
+async def test_subscribe_entities(hass, websocket_client):
+    """Test subscribe entities sends compressed states and their changes."""
+    hass.states.async_set("light.permitted", "off", {"color": "red", "brightness": 5})
+    hass.states.async_set("light.other", "on")
+    state = hass.states.get("light.permitted")
+
+    await websocket_client.send_json(
+        {"id": 7, "type": "subscribe_entities", "entity_ids": ["light.permitted"]}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "a": {
+            "light.permitted": {
+                "s": "off",
+                "a": {"color": "red", "brightness": 5},
+                "c": state.context.id,
+                "lc": state.last_changed.timestamp(),
+            }
+        }
+    }
+
+    hass.states.async_set("light.other", "off")
+    hass.states.async_set("light.permitted", "on", {"color": "red", "brightness": 5})
+    hass.states.async_set("light.permitted", "on", {"color": "blue"})
+    state = hass.states.get("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {
+        "c": {
+            "light.permitted": {
+                "+": {
+                    "s": "on",
+                    "a": {"color": "blue"},
+                    "c": state.context.id,
+                    "lc": state.last_changed.timestamp(),
+                    "lu": state.last_updated.timestamp(),
+                },
+                "-": {"a": ["brightness"]},
+            }
+        }
+    }
+
+    hass.states.async_remove("light.permitted")
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {"r": ["light.permitted"]}
+
+
+async def test_subscribe_entities_with_permissions(
+    hass, websocket_client, hass_admin_user
+):
+    """Test subscribe entities only sends entities the user may read."""
+    hass_admin_user.groups = []
+    hass_admin_user.mock_policy({"entities": {"entity_ids": {"light.permitted": True}}})
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set("light.not_permitted", "off")
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.permitted"]
+
+    hass.states.async_set("light.not_permitted", "on")
+    hass.states.async_set("light.permitted", "on")
+
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["c"]) == ["light.permitted"]
+
+
+async def test_supported_features_coalesce_messages(hass, websocket_client):
+    """Test pending messages are sent in one frame when the client supports it."""
+    await websocket_client.send_json(
+        {"id": 5, "type": "supported_features", "features": {"coalesce_messages": 1}}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "subscribe_events", "event_type": "test_event"}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+
+    hass.bus.async_fire("test_event", {"number": 1})
+    hass.bus.async_fire("test_event", {"number": 2})
+
+    msg = await websocket_client.receive_json()
+    assert [message["id"] for message in msg] == [6, 6]
+    assert [message["event"]["data"]["number"] for message in msg] == [1, 2]
+
+    with patch("homeassistant.components.websocket_api.http.MAX_COALESCED_MESSAGES", 2):
+        for number in range(5):
+            hass.bus.async_fire("test_event", {"number": number})
+
+        frames = [await websocket_client.receive_json() for _ in range(3)]
+
+    assert [
+        [message["event"]["data"]["number"] for message in frame]
+        for frame in frames[:2]
+    ] == [[0, 1], [2, 3]]
+    # A single pending message is sent on its own
+    assert frames[2]["event"]["data"]["number"] == 4
+
+
 async def test_render_template_renders_template(hass, websocket_client):
     """Test simple template is rendered and updated."""
     hass.states.async_set("light.test", "on")
@@ -1,16 +1,18 @@
 """Test Websocket API messages module."""
+import json
+from unittest.mock import patch
 
 from homeassistant.components.websocket_api.messages import (
-    _cached_event_message as lru_event_cache,
     cached_event_message,
+    event_message,
     message_to_json,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
-from homeassistant.core import callback
+from homeassistant.core import Event, State, callback
 
 
 async def test_cached_event_message(hass):
-    """Test that we cache event messages."""
+    """Test that we serialize event messages once."""
 
     events = []
 
@@ -25,7 +27,6 @@ async def test_cached_event_message(hass):
     await hass.async_block_till_done()
 
     assert len(events) == 2
-    lru_event_cache.cache_clear()
 
     msg0 = cached_event_message(2, events[0])
     assert msg0 == cached_event_message(2, events[0])
@@ -34,17 +35,13 @@ async def test_cached_event_message(hass):
     assert msg1 == cached_event_message(2, events[1])
 
     assert msg0 != msg1
+    assert json.loads(msg1) == json.loads(message_to_json(event_message(2, events[1])))
 
-    cache_info = lru_event_cache.cache_info()
-    assert cache_info.hits == 2
-    assert cache_info.misses == 2
-    assert cache_info.currsize == 2
-
-    cached_event_message(2, events[1])
-    cache_info = lru_event_cache.cache_info()
-    assert cache_info.hits == 3
-    assert cache_info.misses == 2
-    assert cache_info.currsize == 2
+    with patch.object(
+        State, "as_dict", side_effect=AssertionError("serialized again")
+    ), patch.object(Event, "as_dict", side_effect=AssertionError("serialized again")):
+        assert cached_event_message(2, events[1]) == msg1
+        assert events[1].data["new_state"].as_json() in msg1
 
 
 async def test_cached_event_message_with_different_idens(hass):
@@ -63,19 +60,27 @@ async def test_cached_event_message_with_different_idens(hass):
 
     assert len(events) == 1
 
-    lru_event_cache.cache_clear()
-
     msg0 = cached_event_message(2, events[0])
     msg1 = cached_event_message(3, events[0])
     msg2 = cached_event_message(4, events[0])
 
     assert msg0 != msg1
     assert msg0 != msg2
+    assert json.loads(msg1)["id"] == 3
+    assert json.loads(msg1)["event"] == json.loads(msg0)["event"]
+
 
-    cache_info = lru_event_cache.cache_info()
-    assert cache_info.hits == 2
-    assert cache_info.misses == 1
-    assert cache_info.currsize == 1
+async def test_cached_event_message_unserializable(hass, caplog):
+    """Test event messages with data that cannot be serialized to JSON."""
+    event = Event("test_event", {"value": _Unserializeable()})
+
+    assert json.loads(cached_event_message(2, event)) == {
+        "id": 2,
+        "type": "result",
+        "success": False,
+        "error": {"code": "unknown_error", "message": "Invalid JSON in response"},
+    }
+    assert "Unable to serialize to JSON" in caplog.text
 
 
 async def test_message_to_json(caplog):
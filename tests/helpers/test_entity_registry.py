@@ -453,6 +453,34 @@ async def test_update_entity_unique_id(registry):
     assert registry.async_get_entity_id("light", "hue", "1234") == entry.entity_id
 
 
+async def test_entries_by_indexed_attributes(registry):
+    """Test entries are looked up by device, area, config entry and platform."""
+    mock_config = MockConfigEntry(domain="light", entry_id="mock-id-1")
+    entry = registry.async_get_or_create(
+        "light", "hue", "5678", config_entry=mock_config, device_id="device-1"
+    )
+    entry2 = registry.async_get_or_create("light", "lifx", "1234")
+
+    assert er.async_entries_for_device(registry, "device-1") == [entry]
+    assert er.async_entries_for_config_entry(registry, "mock-id-1") == [entry]
+    assert er.async_entries_for_platform(registry, "lifx") == [entry2]
+
+    entry = registry.async_update_entity(
+        entry.entity_id, area_id="kitchen", new_entity_id="light.kitchen"
+    )
+    assert er.async_entries_for_area(registry, "kitchen") == [entry]
+    assert er.async_entries_for_device(registry, "device-1") == [entry]
+    assert er.async_entries_for_platform(registry, "hue") == [entry]
+
+    entry = registry.async_update_entity(entry.entity_id, area_id=None)
+    assert er.async_entries_for_area(registry, "kitchen") == []
+
+    registry.async_remove(entry.entity_id)
+    assert er.async_entries_for_device(registry, "device-1") == []
+    assert er.async_entries_for_config_entry(registry, "mock-id-1") == []
+    assert er.async_entries_for_platform(registry, "hue") == []
+
+
 async def test_update_entity_unique_id_conflict(registry):
     """Test migration raises when unique_id already in use."""
     mock_config = MockConfigEntry(domain="light", entry_id="mock-id-1")
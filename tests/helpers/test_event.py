@@ -936,6 +936,44 @@ async def test_track_template_time_change(hass, caplog):
     assert calls[0] == (None, None, None)
 
 
+async def test_track_template_result_shared_render(hass):
+    """Test trackers of the same template share a render per state change."""
+    results = []
+
+    @ha.callback
+    def run_callback(event, updates):
+        results.append(updates[0].result)
+
+    for variables in (None, None, {"offset": 1}):
+        async_track_template_result(
+            hass,
+            [
+                TrackTemplate(
+                    Template(
+                        "{{ (states('sensor.test') | int) + (offset | default(0)) }}",
+                        hass,
+                    ),
+                    variables,
+                )
+            ],
+            run_callback,
+        )
+    await hass.async_block_till_done()
+    results.clear()
+
+    with patch.object(
+        Template,
+        "async_render_to_info",
+        autospec=True,
+        side_effect=Template.async_render_to_info,
+    ) as mock_render:
+        hass.states.async_set("sensor.test", "5")
+        await hass.async_block_till_done()
+
+    assert len(mock_render.mock_calls) == 2
+    assert results == [5, 5, 6]
+
+
 async def test_track_template_result(hass):
     """Test tracking template."""
     specific_runs = []
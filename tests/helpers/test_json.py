@@ -1,10 +1,11 @@
 """Test Home Assistant remote methods and classes."""
 from datetime import timedelta
+import json
 
 import pytest
 
 from homeassistant import core
-from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder
+from homeassistant.helpers.json import ExtendedJSONEncoder, JSONEncoder, json_stream
 from homeassistant.util import dt as dt_util
 
 
@@ -63,3 +64,20 @@ def test_trace_json_encoder(hass):
     # Default method falls back to repr(o)
     o = object()
     assert ha_json_enc.default(o) == {"__type": str(type(o)), "repr": repr(o)}
+
+
+def test_json_stream(hass):
+    """Test encoding JSON in chunks."""
+    now = dt_util.utcnow()
+    states = [core.State(f"test.test{index}", "hello") for index in range(100)]
+    data = [states, [{"state": "on", "last_changed": now}], []]
+    expected = json.loads(json.dumps(data, cls=JSONEncoder))
+
+    chunks = list(json_stream(data, chunk_size=1000))
+    assert len(chunks) > 1
+    assert all(len(chunk) < 2000 for chunk in chunks)
+    assert json.loads("".join(chunks)) == expected
+    assert list(json_stream(data)) == ["".join(chunks)]
+
+    with pytest.raises(ValueError):
+        list(json_stream([float("NaN")]))
@@ -12,6 +12,7 @@ from homeassistant.helpers.restore_state import (
     RestoreEntity,
     RestoreStateData,
     StoredState,
+    _stored_states_as_dicts,
 )
 from homeassistant.util import dt as dt_util
 
@@ -52,6 +53,27 @@ async def test_caching_data(hass):
     assert mock_write_data.called
 
 
+async def test_dump_states_in_executor(hass):
+    """Test the stored states are converted to dicts in the executor."""
+    data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+    data.async_restore_entity_added("input_boolean.b1")
+    hass.states.async_set("input_boolean.b1", "on")
+
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_add_executor_job, patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states()
+
+    assert mock_add_executor_job.call_args[0][0] is _stored_states_as_dicts
+    assert [
+        stored_state["state"]["entity_id"]
+        for stored_state in mock_write_data.call_args[0][0]
+    ] == ["input_boolean.b1"]
+
+
 async def test_periodic_write(hass):
     """Test that we write periodiclly but not after stop."""
     data = await RestoreStateData.async_get_instance(hass)
@@ -73,6 +95,10 @@ async def test_periodic_write(hass):
 
     assert mock_write_data.called
 
+    data = await RestoreStateData.async_get_instance(hass)
+    data.async_restore_entity_added(entity.entity_id)
+    hass.states.async_set(entity.entity_id, "on")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -81,6 +107,15 @@ async def test_periodic_write(hass):
 
     assert mock_write_data.called
 
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
+        await hass.async_block_till_done()
+
+    # No states changed since the last dump
+    assert not mock_write_data.called
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -92,7 +127,7 @@ async def test_periodic_write(hass):
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
-        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=30))
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=45))
         await hass.async_block_till_done()
 
     assert not mock_write_data.called
@@ -137,6 +172,10 @@ async def test_save_persistent_states(hass):
 
     assert mock_write_data.called
 
+    data = await RestoreStateData.async_get_instance(hass)
+    data.async_restore_entity_added(entity.entity_id)
+    hass.states.async_set(entity.entity_id, "on")
+
     with patch(
         "homeassistant.helpers.restore_state.Store.async_save"
     ) as mock_write_data:
@@ -306,6 +345,28 @@ async def test_dump_error(hass):
     assert mock_write_data.called
 
 
+async def test_dump_changed_after_error(hass):
+    """Test a failed dump is retried even if no states changed."""
+    data = await RestoreStateData.async_get_instance(hass)
+    await hass.async_block_till_done()
+    data.async_restore_entity_added("input_boolean.b1")
+    hass.states.async_set("input_boolean.b1", "on")
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save",
+        side_effect=HomeAssistantError,
+    ):
+        await data.async_dump_states()
+
+    with patch(
+        "homeassistant.helpers.restore_state.Store.async_save"
+    ) as mock_write_data:
+        await data.async_dump_states(only_changed=True)
+        await data.async_dump_states(only_changed=True)
+
+    assert mock_write_data.call_count == 1
+
+
 async def test_load_error(hass):
     """Test that we cache data."""
     entity = RestoreEntity()
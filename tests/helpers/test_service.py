@@ -417,6 +417,28 @@ async def test_extract_entity_ids_from_area(hass, area_mock):
     )
 
 
+async def test_extract_entity_ids_from_area_cached(hass, area_mock):
+    """Test resolved area targets are cached until a registry is updated."""
+    call = ha.ServiceCall("light", "turn_on", {"area_id": "own-area"})
+    assert await service.async_extract_entity_ids(hass, call) == {"light.in_own_area"}
+
+    registry = ent_reg.async_get(hass)
+    with patch.object(
+        ent_reg, "async_entries_for_area", side_effect=AssertionError("not cached")
+    ):
+        assert await service.async_extract_entity_ids(hass, call) == {
+            "light.in_own_area"
+        }
+
+    registry.async_update_entity("light.no_area", area_id="own-area")
+    await hass.async_block_till_done()
+
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.in_own_area",
+        "light.no_area",
+    }
+
+
 async def test_extract_entity_ids_from_devices(hass, area_mock):
     """Test extract_entity_ids method with devices."""
     assert await service.async_extract_entity_ids(
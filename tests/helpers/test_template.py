@@ -2690,35 +2690,36 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_template_cache(hass):
+    """Test compiled templates are shared and the cache is bounded."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
-    tpl = template.Template(
-        (template_string),
-    )
+    env = template._NO_HASS_ENV  # pylint: disable=protected-access
+    hits = env.cache_hits
+    misses = env.cache_misses
+
+    tpl = template.Template(template_string)
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert env.template_cache.get(template_string)
+    assert env.cache_misses == misses + 1
 
-    tpl2 = template.Template(
-        (template_string),
-    )
+    tpl2 = template.Template(template_string)
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    assert env.cache_hits == hits + 1
+    assert env.cache_misses == misses + 1
+
+    del tpl, tpl2
+    assert env.template_cache.get(template_string)
+
+    tpl = template.Template(template_string, hass)
+    tpl2 = template.Template(template_string, hass)
+    assert tpl.async_render() == tpl2.async_render() == "foo=x%26y&bar=42"
+    assert tpl._compiled is tpl2._compiled  # pylint: disable=protected-access
+
+    with patch.object(template, "MAX_TEMPLATE_CACHE_SIZE", 1):
+        template.Template("{{ 'evicting' }}").ensure_valid()
+    assert not env.template_cache.get(template_string)
 
 
 def test_is_template_string():
@@ -3,6 +3,7 @@
 import asyncio
 from datetime import datetime, timedelta
 import functools
+import json
 import logging
 import os
 from tempfile import TemporaryDirectory
@@ -38,6 +39,7 @@ from homeassistant.exceptions import (
     MaxLengthExceeded,
     ServiceNotFound,
 )
+from homeassistant.helpers.json import JSONEncoder
 import homeassistant.util.dt as dt_util
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -383,6 +385,26 @@ def test_state_as_dict():
     assert state.as_dict() is state.as_dict()
 
 
+def test_state_and_event_as_json():
+    """Test the JSON of a State and an Event is serialized once."""
+    state = ha.State("happy.happy", "on", {"pig": "dog"})
+    assert json.loads(state.as_json()) == state.as_dict()
+    assert state.as_json() is state.as_json()
+
+    event = ha.Event(
+        EVENT_STATE_CHANGED,
+        {"entity_id": "happy.happy", "old_state": None, "new_state": state},
+    )
+    assert json.loads(event.as_json()) == json.loads(
+        json.dumps(event.as_dict(), cls=JSONEncoder)
+    )
+    assert state.as_json() in event.as_json()
+    assert event.as_json() is event.as_json()
+
+    with pytest.raises(ValueError):
+        ha.State("happy.happy", "on", {"pig": float("nan")}).as_json()
+
+
 async def test_eventbus_add_remove_listener(hass):
     """Test remove_listener method."""
     old_count = len(hass.bus.async_listeners())
@@ -431,6 +453,65 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass):
+    """Test listeners keyed by a value in the event data."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed("test", "entity_id", ["light.a"], listener)
+    assert hass.bus.async_listeners()["test"] == 1
+    assert hass.bus.async_keyed_listeners("test", "entity_id") == {"light.a": 1}
+
+    hass.bus.async_fire("test", {"entity_id": "light.b"})
+    hass.bus.async_fire("test", {"entity_id": ["light.a"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.a"})
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    unsub()
+    assert "test" not in hass.bus.async_listeners()
+    assert hass.bus.async_keyed_listeners("test", "entity_id") == {}
+
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+
+async def test_eventbus_keyed_listener_duplicate_values(hass):
+    """Test a keyed listener registered with duplicate values."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed(
+        "test", "entity_id", ["light.a", "light.b", "light.a"], listener
+    )
+    assert hass.bus.async_keyed_listeners("test", "entity_id") == {
+        "light.a": 1,
+        "light.b": 1,
+    }
+
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    unsub()
+    assert "test" not in hass.bus.async_listeners()
+    assert hass.bus.async_keyed_listeners("test", "entity_id") == {}
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -728,6 +809,90 @@ async def test_statemachine_force_update(hass):
     assert len(events) == 1
 
 
+async def test_statemachine_shares_unchanged_attributes(hass):
+    """Test a state with unchanged attributes shares the previous mapping."""
+    hass.states.async_set("light.bowl", "on", {"brightness": 100})
+    old_state = hass.states.get("light.bowl")
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 100})
+    state = hass.states.get("light.bowl")
+    assert state.attributes is old_state.attributes
+
+    hass.states.async_set("light.bowl", "off", {"brightness": 50})
+    assert hass.states.get("light.bowl").attributes == {"brightness": 50}
+
+
+async def test_statemachine_set_many(hass):
+    """Test setting the states of a batch of entities."""
+    hass.states.async_set("light.bowl", "on", {})
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+    keyed_calls = []
+    hass.bus.async_listen_keyed(
+        EVENT_STATE_CHANGED,
+        "entity_id",
+        ["light.kitchen"],
+        ha.callback(lambda event: keyed_calls.append(event)),
+    )
+
+    hass.states.async_set_many(
+        [
+            ("light.bowl", "on", None),
+            ("Light.Kitchen", "on", {"brightness": 100}),
+            ("switch.ac", "off", None),
+        ]
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.kitchen").attributes == {"brightness": 100}
+    assert hass.states.get("switch.ac").state == "off"
+    assert [event.data["entity_id"] for event in events] == [
+        "light.kitchen",
+        "switch.ac",
+    ]
+    assert events[0].context is events[1].context
+    assert events[0].time_fired == events[1].time_fired
+    assert events[1].data["old_state"] is None
+    assert [event.data["entity_id"] for event in keyed_calls] == ["light.kitchen"]
+
+    hass.states.async_set_many([("light.bowl", "on", None)])
+    await hass.async_block_till_done()
+    assert len(events) == 2
+
+
+async def test_statemachine_set_many_invalid(hass):
+    """Test an invalid state in a batch leaves the state machine unchanged."""
+    hass.states.async_set("light.bowl", "on", {})
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    with pytest.raises(InvalidEntityFormatError):
+        hass.states.async_set_many(
+            [
+                ("light.bowl", "off", None),
+                ("invalid_entity_id", "on", None),
+                ("switch.ac", "off", None),
+            ]
+        )
+    with pytest.raises(InvalidStateError):
+        hass.states.async_set_many(
+            [("light.bowl", "off", None), ("switch.ac", "x" * 256, None)]
+        )
+    await hass.async_block_till_done()
+
+    assert hass.states.get("light.bowl").state == "on"
+    assert hass.states.get("switch.ac") is None
+    assert hass.states.async_entity_ids() == ["light.bowl"]
+    assert len(events) == 0
+
+    hass.states.async_set_many(
+        [("light.bowl", "off", None), ("light.bowl", "on", None)]
+    )
+    await hass.async_block_till_done()
+    assert [
+        (event.data["old_state"].state, event.data["new_state"].state)
+        for event in events
+    ] == [("on", "off"), ("off", "on")]
+
+
 def test_service_call_repr():
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
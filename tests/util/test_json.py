@@ -53,6 +53,16 @@ def test_save_and_load():
     assert data == TEST_JSON_A
 
 
+def test_save_and_load_compact():
+    """Test saving compact JSON and loading it back."""
+    fname = _path_for("test_compact")
+    save_json(fname, TEST_JSON_A, compact=True)
+    with open(fname, encoding="utf-8") as fdesc:
+        assert fdesc.read() == '{"a":1,"B":"two"}'
+    data = load_json(fname)
+    assert data == TEST_JSON_A
+
+
 # Skipped on Windows
 @unittest.skipIf(
     sys.platform.startswith("win"), "private permissions not supported on Windows"